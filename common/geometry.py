@@ -14,8 +14,13 @@ class Point3D:
         x (float): X 座標
         y (float): Y 座標
         z (float): Z 座標
+
+    座標は生成時に一度だけ float に変換されるため、利用側での再変換は不要。
     """
 
+    # 大量に生成されるため、インスタンス辞書を持たない
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x, y, z):
         """
         コンストラクタ
@@ -25,9 +30,14 @@ class Point3D:
             y (float): Y 座標
             z (float): Z 座標
         """
-        self.x = x
-        self.y = y
-        self.z = z
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @property
+    def xyz(self):
+        """座標を (x, y, z) タプルで返す（一括アンパック用）"""
+        return (self.x, self.y, self.z)
 
     def to_list(self):
         """座標をリスト形式で返す"""
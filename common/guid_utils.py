@@ -1,4 +1,5 @@
 import ifcopenshell.guid
+import os
 import uuid
 
 
@@ -20,6 +21,26 @@ def create_ifc_guid() -> str:
             return ifcopenshell.guid.compress(hex_str)
 
 
+def create_ifc_guids(count: int) -> list:
+    """新しいIFC GUID を一括生成します。
+
+    乱数を1回の os.urandom でまとめて取得し、UUID4として整形します。
+
+    Args:
+        count: 生成するGUIDの数
+
+    Returns:
+        list: IFC形式の圧縮されたGUIDのリスト
+    """
+    random_bytes = os.urandom(16 * count)
+    return [
+        ifcopenshell.guid.compress(
+            uuid.UUID(bytes=random_bytes[i : i + 16], version=4).hex
+        )
+        for i in range(0, 16 * count, 16)
+    ]
+
+
 def convert_stb_guid_to_ifc(stb_guid: str) -> str:
     """Convert ST-Bridge GUID (32 hex chars) to IFC compressed GUID."""
     if not stb_guid:
@@ -0,0 +1,30 @@
+"""IFCファイル単位の共有キャッシュ
+
+Creator/Serviceのインスタンスを跨いで再利用するエンティティを
+IFCファイル毎に保持する。
+"""
+
+import weakref
+from typing import Any, Dict
+
+# {IFCファイル: {キャッシュ名: 辞書}}
+# （ファイルが破棄されるとエントリも自動的に解放される）
+_shared_file_caches = weakref.WeakKeyDictionary()
+
+
+def get_file_cache(ifc_file, name: str) -> Dict[Any, Any]:
+    """IFCファイルに紐づく共有キャッシュ辞書を取得
+
+    Args:
+        ifc_file: IFCファイル（Noneの場合は共有しない空の辞書を返す）
+        name: キャッシュ名（エンティティ種別など）
+
+    Returns:
+        キャッシュ辞書
+    """
+    if ifc_file is None:
+        return {}
+    file_caches = _shared_file_caches.get(ifc_file)
+    if file_caches is None:
+        file_caches = _shared_file_caches[ifc_file] = {}
+    return file_caches.setdefault(name, {})
@@ -4,11 +4,17 @@
 旧バージョンとの互換性を考慮した統一的な命名規則を提供
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# プロファイル名先頭の形状キーワード（H/I形鋼・角形鋼管・中空・矩形）
+# HOLLOW を H より先に置き、前方一致で最長のキーワードを採用する
+_PROFILE_SHAPE_RE = re.compile(r"^(?:HOLLOW|BOX|RECT|H|I)")
+
 
 class ProfileNamingStandards:
     """プロファイル命名規則の統一クラス"""
@@ -224,4 +230,27 @@ class ProfileNamingStandards:
     def get_naming_mode_for_compatibility(cls) -> str:
         """互換性のための命名モードを取得"""
         # 現在は旧バージョンとの互換性を重視
-        return 'legacy'
\ No newline at end of file
+        return 'legacy'
+
+
+@lru_cache(maxsize=1024)
+def classify_profile(profile_name: Optional[str]) -> str:
+    """プロファイル名を形状クラスに分類
+
+    材料・型の選択で共通に使用する分類を、名前先頭のキーワード照合1回で求める。
+    大文字・小文字は区別しない。
+
+    Args:
+        profile_name: プロファイル名
+
+    Returns:
+        "H"（H/I形鋼）、"BOX"、"HOLLOW"、"RECT"、または "OTHER"
+    """
+    if not profile_name:
+        return "OTHER"
+
+    match = _PROFILE_SHAPE_RE.match(profile_name.upper())
+    if match is None:
+        return "OTHER"
+    shape = match.group()
+    return "H" if shape == "I" else shape
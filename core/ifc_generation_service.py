@@ -7,6 +7,7 @@ from utils.logger import get_logger
 from exceptions.custom_errors import ConversionError
 from ifcCreator.core.element_creation_factory import ElementCreationFactory
 from ifcCreator.core.ifc_project_builder import IFCProjectBuilder
+from ifcCreator.services.property_service import flush_shared_property_sets
 
 # ElementTrackerはElementCreationFactoryに統合済み
 
@@ -269,6 +270,7 @@ class IfcGenerationService:
 
         # 要素関連付けとファイル出力
         converter.associate_elements_to_storeys()
+        flush_shared_property_sets(builder.file)
         builder.file.write(output_filename)
 
         self.logger.info(
@@ -410,6 +412,7 @@ class IfcGenerationService:
 
             # ファイルを保存
             if project_builder.file:
+                flush_shared_property_sets(project_builder.file)
                 project_builder.file.write(filename)
                 return True
             else:
@@ -85,6 +85,11 @@ class IfcCreator:
             logger.info(f"  {element_type}: {count}個")
 
         if project_builder.file:
+            from ifcCreator.services.property_service import (
+                flush_shared_property_sets,
+            )
+
+            flush_shared_property_sets(project_builder.file)
             project_builder.file.write(filename)
             logger.info(f"IFCファイルを保存しました: {filename}")
         return project_builder.file
@@ -176,7 +176,7 @@ class ElementCreationFactory:
     def create_walls(self, wall_defs: List[Dict]) -> List:
         """壁要素を生成"""
         try:
-            walls = self._creators["wall"].create_elements(wall_defs)
+            walls = self._creators["wall"].create_walls(wall_defs)
 
             # 作成要素の追跡
             for i, wall in enumerate(walls):
@@ -8,6 +8,8 @@ from typing import Optional, Any, Dict, List
 from abc import ABC, abstractmethod
 import logging
 
+from common.ifc_file_cache import get_file_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,11 +41,15 @@ class BaseElementCreator(ABC):
         """
         pass
     
-    def create_elements(self, definitions: List[Dict[str, Any]]) -> List[Any]:
+    def create_elements(
+        self, definitions: List[Dict[str, Any]], *, strict: bool = True
+    ) -> List[Any]:
         """複数要素を作成
         
         Args:
             definitions: 要素定義リスト
+            strict: False の場合、検証済みの定義として要素毎の検証を省略
+                （create_element が strict を受け付けるCreatorのみ指定可）
             
         Returns:
             作成されたIFC要素のリスト
@@ -51,7 +57,10 @@ class BaseElementCreator(ABC):
         elements = []
         for i, definition in enumerate(definitions):
             try:
-                element = self.create_element(definition)
+                if strict:
+                    element = self.create_element(definition)
+                else:
+                    element = self.create_element(definition, strict=False)
                 if element:
                     elements.append(element)
                     self._element_count += 1
@@ -61,6 +70,74 @@ class BaseElementCreator(ABC):
         self.logger.info(f"Created {len(elements)} elements")
         return elements
     
+    def _get_entity_cache(self, name: str) -> Dict[Any, Any]:
+        """現在のIFCファイルに紐づく共有エンティティキャッシュを取得
+        
+        Args:
+            name: キャッシュ名（エンティティ種別など）
+            
+        Returns:
+            キャッシュ辞書
+        """
+        return get_file_cache(self.project_builder.file, name)
+    
+    def _get_direction(self, ratios) -> Any:
+        """同一方向のIfcDirectionを再利用して取得
+        
+        Args:
+            ratios: 方向ベクトル (x, y, z)
+            
+        Returns:
+            IfcDirection
+        """
+        key = tuple(round(r, 9) for r in ratios)
+        cache = self._get_entity_cache("IfcDirection")
+        direction = cache.get(key)
+        if direction is None:
+            direction = cache[key] = self.project_builder.file.createIfcDirection(
+                list(ratios)
+            )
+        return direction
+    
+    def _get_cartesian_point(self, coordinates) -> Any:
+        """同一座標のIfcCartesianPointを再利用して取得
+        
+        Args:
+            coordinates: 座標 (x, y, z)
+            
+        Returns:
+            IfcCartesianPoint
+        """
+        key = tuple(round(c, 9) for c in coordinates)
+        cache = self._get_entity_cache("IfcCartesianPoint")
+        point = cache.get(key)
+        if point is None:
+            point = cache[key] = self.project_builder.file.createIfcCartesianPoint(
+                list(coordinates)
+            )
+        return point
+    
+    def _get_local_placement(self, coordinates) -> Any:
+        """同一位置の絶対配置（回転なし）のIfcLocalPlacementを再利用して取得
+        
+        Args:
+            coordinates: 配置原点 (x, y, z)
+            
+        Returns:
+            IfcLocalPlacement
+        """
+        key = tuple(round(c, 9) for c in coordinates)
+        cache = self._get_entity_cache("IfcLocalPlacement")
+        placement = cache.get(key)
+        if placement is None:
+            ifc_file = self.project_builder.file
+            placement = cache[key] = ifc_file.createIfcLocalPlacement(
+                RelativePlacement=ifc_file.createIfcAxis2Placement3D(
+                    Location=self._get_cartesian_point(coordinates)
+                )
+            )
+        return placement
+    
     @property
     def element_count(self) -> int:
         """作成された要素数を取得"""
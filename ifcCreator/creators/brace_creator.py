@@ -440,18 +440,18 @@ class BraceCreator(LinearElementCreator):
                 # 軸方向・参照方向ベクトルを使用した精密配置
                 location = ifc_file.createIfcCartesianPoint(
                     [
-                        float(placement_info["origin"].x),
-                        float(placement_info["origin"].y),
-                        float(placement_info["origin"].z),
+                        float(placement_info.origin.x),
+                        float(placement_info.origin.y),
+                        float(placement_info.origin.z),
                     ]
                 )
 
                 # 軸方向ベクトル
-                axis = ifc_file.createIfcDirection(placement_info["direction"])
+                axis = ifc_file.createIfcDirection(placement_info.direction)
 
                 # 参照方向ベクトル
                 ref_direction = ifc_file.createIfcDirection(
-                    placement_info["ref_direction"]
+                    placement_info.ref_direction
                 )
 
                 # 精密な配置
@@ -460,9 +460,9 @@ class BraceCreator(LinearElementCreator):
                 )
 
                 self.logger.debug(
-                    f"ブレース精密配置: origin={placement_info['origin']}, "
-                    f"axis={placement_info['direction']}, "
-                    f"ref_direction={placement_info['ref_direction']}"
+                    f"ブレース精密配置: origin={placement_info.origin}, "
+                    f"axis={placement_info.direction}, "
+                    f"ref_direction={placement_info.ref_direction}"
                 )
 
                 return ifc_file.createIfcLocalPlacement(
@@ -2,6 +2,18 @@
 
 import uuid
 
+from common.ifc_file_cache import get_file_cache
+from common.profile_naming_standards import classify_profile
+
+# プロファイル分類 → 材料作成メソッド名
+_PROFILE_MATERIAL_FACTORIES = {
+    "H": "create_steel_material",
+    "BOX": "create_steel_material",
+    "HOLLOW": "create_steel_material",
+    "RECT": "create_concrete_material",
+    "OTHER": "create_steel_material",  # デフォルトは鋼材
+}
+
 
 class MaterialCreator:
     """IFC材料定義（Material、MaterialProfile等）を作成するクラス"""
@@ -14,7 +26,8 @@ class MaterialCreator:
         """
         self.ifc_file = ifc_file
         self.owner_history = owner_history
-        self._materials_cache = {}
+        # IFCファイル毎に全インスタンスで共有する材料キャッシュ
+        self._materials_cache = get_file_cache(ifc_file, "IfcMaterial")
 
     def create_material(self, name, description=None):
         """材料を作成
@@ -99,14 +112,8 @@ class MaterialCreator:
 
     def get_material_for_profile(self, profile_name):
         """プロファイル名に基づいて適切な材料を取得"""
-        if any(
-            keyword in profile_name.upper() for keyword in ["H", "I", "BOX", "HOLLOW"]
-        ):
-            return self.create_steel_material()
-        elif "RECT" in profile_name.upper():
-            return self.create_concrete_material()
-        else:
-            return self.create_steel_material()  # デフォルトは鋼材
+        factory_name = _PROFILE_MATERIAL_FACTORIES[classify_profile(profile_name)]
+        return getattr(self, factory_name)()
 
     def create_material_for_element_type(self, element_type, profile_name=None):
         """要素タイプに基づいて材料を作成・取得
@@ -10,9 +10,13 @@ from ..utils.validator import Validator
 from common.geometry import Point3D
 from exceptions.custom_errors import ParameterValidationError, GeometryValidationError
 import logging
+import operator
 
 logger = logging.getLogger(__name__)
 
+# 座標辞書から (x, y, z) を一括取得
+_xyz = operator.itemgetter("x", "y", "z")
+
 
 class SlabCreator(PlanarElementCreator):
     """統合スラブ作成クラス"""
@@ -22,15 +26,23 @@ class SlabCreator(PlanarElementCreator):
         self.element_type = "slab"
         self.validator = Validator()
 
-    def create_element(self, definition: Dict[str, Any]) -> Optional[Any]:
-        """スラブ要素を作成"""
+    def create_element(
+        self, definition: Dict[str, Any], strict: bool = True
+    ) -> Optional[Any]:
+        """スラブ要素を作成
+
+        Args:
+            definition: スラブ定義辞書
+            strict: False の場合、検証済みの定義として個別バリデーションを省略
+        """
         try:
-            # パラメータ検証
-            try:
-                self.validator.validate_slab_definition(definition)
-            except ValueError as e:
-                slab_name = definition.get("name", "不明なスラブ")
-                raise ParameterValidationError("スラブ", slab_name, str(e)) from e
+            # パラメータ検証（検証済みバッチでは省略）
+            if strict:
+                try:
+                    self.validator.validate_slab_definition(definition)
+                except ValueError as e:
+                    slab_name = definition.get("name", "不明なスラブ")
+                    raise ParameterValidationError("スラブ", slab_name, str(e)) from e
             
             # 定義から必要パラメータを抽出
             corner_nodes = definition.get("corner_nodes")
@@ -59,9 +71,11 @@ class SlabCreator(PlanarElementCreator):
             # Point3Dオブジェクトのリストを作成
             corner_points = []
             if corner_nodes and isinstance(corner_nodes, list):
-                for node in corner_nodes:
-                    if isinstance(node, dict):
-                        corner_points.append(Point3D(node["x"], node["y"], node["z"]))
+                corner_points = [
+                    Point3D(*_xyz(node))
+                    for node in corner_nodes
+                    if isinstance(node, dict)
+                ]
 
             if center_point and isinstance(center_point, dict):
                 center_point = Point3D(
@@ -70,7 +84,8 @@ class SlabCreator(PlanarElementCreator):
 
             if not all([corner_points, slab_section]):
                 self.logger.error(
-                    f"必須パラメータが不足しています: corner_points={len(corner_points) if corner_points else 0}, slab_section={slab_section}"
+                    "必須パラメータが不足しています: corner_points=%d, slab_section=%s",
+                    len(corner_points), slab_section,
                 )
                 return None
 
@@ -120,11 +135,17 @@ class SlabCreator(PlanarElementCreator):
             # 中心点を決定
             if center_point:
                 effective_center = center_point
-                self.logger.debug(f"スラブ '{slab_name}' の配置に提供された中心点を使用: ({center_point.x:.1f}, {center_point.y:.1f}, {center_point.z:.1f})")
+                self.logger.debug(
+                    "スラブ '%s' の配置に提供された中心点を使用: (%.1f, %.1f, %.1f)",
+                    slab_name, center_point.x, center_point.y, center_point.z,
+                )
             else:
                 # center_pointが提供されていない場合は角点から計算
                 effective_center = self._calculate_center_from_corners(corner_points)
-                self.logger.debug(f"スラブ '{slab_name}' の配置に計算された中心点を使用: ({effective_center.x:.1f}, {effective_center.y:.1f}, {effective_center.z:.1f})")
+                self.logger.debug(
+                    "スラブ '%s' の配置に計算された中心点を使用: (%.1f, %.1f, %.1f)",
+                    slab_name, effective_center.x, effective_center.y, effective_center.z,
+                )
 
             # スラブのジオメトリ作成（ローカル座標系）
             shape = self._create_slab_geometry(corner_points, slab_section, effective_center)
@@ -143,7 +164,7 @@ class SlabCreator(PlanarElementCreator):
             if slab:
                 # プロパティ設定
                 self._set_slab_properties(slab, corner_points, slab_section)
-                self.logger.debug(f"スラブ '{slab_name}' を作成しました")
+                self.logger.debug("スラブ '%s' を作成しました", slab_name)
 
             return slab
 
@@ -169,9 +190,9 @@ class SlabCreator(PlanarElementCreator):
             ifc_points = []
             for point in corner_points:
                 # 中心点からの相対座標に変換
-                local_x = float(point.x - center_point.x)
-                local_y = float(point.y - center_point.y)
-                local_z = float(point.z - center_point.z)
+                local_x = point.x - center_point.x
+                local_y = point.y - center_point.y
+                local_z = point.z - center_point.z
                 
                 ifc_points.append(
                     ifc_file.createIfcCartesianPoint([local_x, local_y, local_z])
@@ -222,11 +243,7 @@ class SlabCreator(PlanarElementCreator):
 
             # 参照点を配置位置として使用
             location = ifc_file.createIfcCartesianPoint(
-                [
-                    float(reference_point.x),
-                    float(reference_point.y),
-                    float(reference_point.z),
-                ]
+                [reference_point.x, reference_point.y, reference_point.z]
             )
 
             # 簡易的な配置（回転なし）
@@ -317,6 +334,11 @@ class SlabCreator(PlanarElementCreator):
         
         return Point3D(center_x, center_y, center_z)
 
-    def create_slabs(self, slab_definitions: list) -> list:
-        """複数のスラブを作成"""
-        return self.create_elements(slab_definitions)
+    def create_slabs(self, slab_definitions: list, strict: bool = True) -> list:
+        """複数のスラブを作成
+
+        Args:
+            slab_definitions: スラブ定義リスト
+            strict: False の場合、ドキュメント単位で検証済みとしてスラブ毎の検証を省略
+        """
+        return self.create_elements(slab_definitions, strict=strict)
@@ -2,6 +2,27 @@
 
 import uuid
 
+from common.ifc_file_cache import get_file_cache
+from common.profile_naming_standards import classify_profile
+
+# プロファイル分類 → 梁タイプ名
+_BEAM_TYPE_NAMES = {
+    "H": "SteelBeam",
+    "BOX": "StandardBeam",
+    "HOLLOW": "SteelBeam",
+    "RECT": "ConcreteBeam",
+    "OTHER": "StandardBeam",
+}
+
+# プロファイル分類 → 柱タイプ名
+_COLUMN_TYPE_NAMES = {
+    "H": "SteelColumn",
+    "BOX": "CFTColumn",
+    "HOLLOW": "SteelColumn",
+    "RECT": "ConcreteColumn",
+    "OTHER": "StandardColumn",
+}
+
 
 class TypeCreator:
     """IFC型定義（BeamType、ColumnType等）を作成するクラス"""
@@ -14,7 +35,8 @@ class TypeCreator:
         """
         self.ifc_file = ifc_file
         self.owner_history = owner_history
-        self._types_cache = {}
+        # IFCファイル毎に全インスタンスで共有する型キャッシュ
+        self._types_cache = get_file_cache(ifc_file, "IfcTypeObject")
 
     def create_beam_type(self, type_name="StandardBeam"):
         """梁タイプを作成
@@ -131,20 +153,10 @@ class TypeCreator:
 
     def get_beam_type_for_profile(self, profile_name):
         """プロファイル名に基づいて適切な梁タイプを取得"""
-        if "H" in profile_name or "I" in profile_name:
-            return self.create_beam_type("SteelBeam")
-        elif "RECT" in profile_name:
-            return self.create_beam_type("ConcreteBeam")
-        else:
-            return self.create_beam_type("StandardBeam")
+        return self.create_beam_type(_BEAM_TYPE_NAMES[classify_profile(profile_name)])
 
     def get_column_type_for_profile(self, profile_name):
         """プロファイル名に基づいて適切な柱タイプを取得"""
-        if "H" in profile_name or "I" in profile_name:
-            return self.create_column_type("SteelColumn")
-        elif "BOX" in profile_name:
-            return self.create_column_type("CFTColumn")
-        elif "RECT" in profile_name:
-            return self.create_column_type("ConcreteColumn")
-        else:
-            return self.create_column_type("StandardColumn")
+        return self.create_column_type(
+            _COLUMN_TYPE_NAMES[classify_profile(profile_name)]
+        )
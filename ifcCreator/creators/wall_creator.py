@@ -3,17 +3,63 @@
 v2.2.0 統合壁作成クラス
 """
 
+from functools import lru_cache
 from typing import Optional, Any, Dict, List
 from .base_creator import PlanarElementCreator
 from ..utils.structural_section import StructuralSection
 from ..utils.validator import Validator
+from ..geometry.face_geometry import (
+    FaceBasis,
+    calculate_face_axes,
+    calculate_face_normal,
+    calculate_rectangle_bounds,
+    calculate_vertical_face_axes,
+)
 from common.geometry import Point3D
+from common.guid_utils import convert_stb_guid_to_ifc, create_ifc_guid
 from exceptions.custom_errors import ParameterValidationError, GeometryValidationError
 import logging
-import math
+import operator
 
 logger = logging.getLogger(__name__)
 
+# 座標辞書から (x, y, z) を一括取得
+_xyz = operator.itemgetter("x", "y", "z")
+
+
+@lru_cache(maxsize=1024)
+def _build_wall_section(
+    name: str, section_type: str, properties: tuple
+) -> StructuralSection:
+    """同一内容の断面定義から作成したStructuralSectionを共有する
+
+    返される断面は複数の壁で共有されるため、変更しないこと。
+    """
+    return StructuralSection(
+        name=name, section_type=section_type, **dict(properties)
+    )
+
+
+def _section_from_data(section_data: Dict[str, Any]) -> StructuralSection:
+    """STB断面辞書からStructuralSectionを取得（同一内容はキャッシュを再利用）"""
+    name = section_data.get("stb_name", "")
+    section_type = section_data.get("section_type", "")
+    # 重複を避けるため、name と section_type を除いたプロパティを作成
+    properties = tuple(
+        sorted(
+            (k, v)
+            for k, v in section_data.items()
+            if k not in ("stb_name", "section_type")
+        )
+    )
+    try:
+        return _build_wall_section(name, section_type, properties)
+    except TypeError:
+        # ハッシュ不可能な値を含む場合はキャッシュを使用しない
+        return StructuralSection(
+            name=name, section_type=section_type, **dict(properties)
+        )
+
 
 class WallCreator(PlanarElementCreator):
     """統合壁作成クラス"""
@@ -42,28 +88,16 @@ class WallCreator(PlanarElementCreator):
             section_data = definition.get("section")
             wall_section = None
             if section_data:
-                # 重複を避けるため、name と section_type を除いた辞書を作成
-                other_properties = {
-                    k: v
-                    for k, v in section_data.items()
-                    if k not in ["stb_name", "section_type"]
-                }
-                wall_section = StructuralSection(
-                    name=section_data.get("stb_name", ""),
-                    section_type=section_data.get("section_type", ""),
-                    **other_properties,
-                )
+                wall_section = _section_from_data(section_data)
 
             wall_name = definition.get("name", "Wall")
             wall_tag = definition.get("tag", "W001")
             stb_guid = definition.get("stb_guid")
 
-            # Point3Dオブジェクトのリストを作成
-            corner_points = []
-            if corner_nodes and isinstance(corner_nodes, list):
-                for node in corner_nodes:
-                    if isinstance(node, dict):
-                        corner_points.append(Point3D(node["x"], node["y"], node["z"]))
+            # 角点座標を (x, y, z) タプルの配列として取り出し、
+            # 公開API用のPoint3Dはその配列から作成
+            corner_xyz = self._corner_xyz(corner_nodes)
+            corner_points = [Point3D(*xyz) for xyz in corner_xyz]
 
             if center_point and isinstance(center_point, dict):
                 center_point = Point3D(
@@ -84,6 +118,7 @@ class WallCreator(PlanarElementCreator):
                 wall_name,
                 wall_tag,
                 stb_guid,
+                corner_xyz=corner_xyz,
             )
 
         except Exception as e:
@@ -105,6 +140,7 @@ class WallCreator(PlanarElementCreator):
         wall_name: str = "Wall",
         wall_tag: str = "W001",
         stb_guid: Optional[str] = None,
+        corner_xyz: Optional[List[tuple]] = None,
     ) -> Any:
         """壁を作成
 
@@ -116,6 +152,7 @@ class WallCreator(PlanarElementCreator):
             wall_name: 壁名
             wall_tag: 壁タグ
             stb_guid: STB GUID
+            corner_xyz: 角点の (x, y, z) タプル配列（オプション、未指定時は角点から作成）
 
         Returns:
             作成されたIFC壁要素
@@ -130,14 +167,26 @@ class WallCreator(PlanarElementCreator):
             # 中心点を決定
             if center_point:
                 effective_center = center_point
-                self.logger.debug(f"壁 '{wall_name}' の配置に提供された中心点を使用: ({center_point.x:.1f}, {center_point.y:.1f}, {center_point.z:.1f})")
+                self.logger.debug(
+                    "壁 '%s' の配置に提供された中心点を使用: (%.1f, %.1f, %.1f)",
+                    wall_name, center_point.x, center_point.y, center_point.z,
+                )
             else:
                 # center_pointが提供されていない場合は角点から計算
                 effective_center = self._calculate_center_from_corners(corner_points)
-                self.logger.debug(f"壁 '{wall_name}' の配置に計算された中心点を使用: ({effective_center.x:.1f}, {effective_center.y:.1f}, {effective_center.z:.1f})")
+                self.logger.debug(
+                    "壁 '%s' の配置に計算された中心点を使用: (%.1f, %.1f, %.1f)",
+                    wall_name, effective_center.x, effective_center.y, effective_center.z,
+                )
 
             # 壁のジオメトリ作成（ローカル座標系）
-            shape, local_coord = self._create_wall_geometry(corner_points, wall_section, openings, effective_center)
+            shape, local_coord = self._create_wall_geometry(
+                corner_points,
+                wall_section,
+                openings,
+                effective_center,
+                corner_xyz,
+            )
 
             if not shape:
                 return None
@@ -156,11 +205,17 @@ class WallCreator(PlanarElementCreator):
                 
                 # 開口部がある場合、開口要素を作成
                 if openings:
+                    props = wall_section.properties
                     self._create_wall_openings(
-                        wall, openings, wall_section, local_coord
+                        wall,
+                        openings,
+                        float(props.get("thickness", 250.0)),
+                        float(props.get("length", 6000.0)),
+                        float(props.get("height", 4500.0)),
+                        local_coord,
                     )
                 
-                self.logger.debug(f"壁 '{wall_name}' を作成しました")
+                self.logger.debug("壁 '%s' を作成しました", wall_name)
 
             return wall
 
@@ -174,6 +229,7 @@ class WallCreator(PlanarElementCreator):
         wall_section: StructuralSection,
         openings: List[Dict] = None,
         center_point: Point3D = None,
+        corner_xyz: Optional[List[tuple]] = None,
     ):
         """壁ジオメトリを作成（ローカル座標系）"""
         try:
@@ -182,53 +238,39 @@ class WallCreator(PlanarElementCreator):
 
             ifc_file = self.project_builder.file
 
-            # 角点からポリゴンを作成（3点以上想定、4点未満の場合は拡張）
+            # 角点からポリゴンを作成（3点以上想定、ポリラインは末尾で閉じる）
             if len(corner_points) < 3:
                 self.logger.error("壁には最低3つの角点が必要です")
                 return None, None
             
-            # 3点の場合は4点に拡張（最初の点を複製）
-            if len(corner_points) == 3:
-                corner_points = corner_points + [corner_points[0]]
-                self.logger.debug("3点の壁を4点に拡張しました")
+            # 角点座標を (x, y, z) タプルの配列として扱う
+            if corner_xyz is None:
+                corner_xyz = self._points_to_xyz(corner_points)
 
             # 中心点を計算（未提供の場合）
             if not center_point:
-                center_point = self._calculate_center_from_corners(corner_points)
-
-            # 角点を辞書形式に変換（面の法線計算のため）
-            corner_nodes = []
-            for point in corner_points[:4]:
-                corner_nodes.append({"x": point.x, "y": point.y, "z": point.z})
+                center_point = Point3D(*self._centroid(corner_xyz))
 
             # 面のローカル座標系を計算（正確な押し出し方向のため）
             local_coord = self._create_face_local_coordinate_system(
-                corner_nodes, {"x": center_point.x, "y": center_point.y, "z": center_point.z}
+                corner_xyz[:4], (center_point.x, center_point.y, center_point.z)
             )
 
             # 2Dプロファイルを作成（旧版の正確な実装に合わせる）
-            profile_points = []
-            for node in corner_nodes:
-                local_2d = self._transform_to_local_2d(node, local_coord)
-                profile_points.append(local_2d)
-
-            ifc_points = [ifc_file.createIfcCartesianPoint(p) for p in profile_points]
-            polyline = ifc_file.createIfcPolyLine(ifc_points + [ifc_points[0]])
-            profile = ifc_file.createIfcArbitraryClosedProfileDef(
-                ProfileType="AREA", OuterCurve=polyline
-            )
+            profile_points = self._project_to_local_2d(corner_xyz[:4], local_coord)
+
+            profile = self._create_wall_profile(profile_points)
 
             # 壁の厚さを取得
-            thickness = wall_section.properties.get(
-                "thickness", 250.0
-            )  # デフォルト250mm
+            props = wall_section.properties
+            thickness = float(props.get("thickness", 250.0))  # デフォルト250mm
 
             # 押し出し基準位置を計算（中心点から法線逆方向に厚さ/2オフセット）
-            relative_base_location = ifc_file.createIfcCartesianPoint(
-                [0.0, 0.0, -thickness / 2.0]
+            relative_base_location = self._get_cartesian_point(
+                (0.0, 0.0, -thickness / 2.0)
             )
-            relative_axis = ifc_file.createIfcDirection([0.0, 0.0, 1.0])  # ローカルZ軸
-            relative_ref_dir = ifc_file.createIfcDirection([1.0, 0.0, 0.0])  # ローカルX軸
+            relative_axis = self._get_direction((0.0, 0.0, 1.0))  # ローカルZ軸
+            relative_ref_dir = self._get_direction((1.0, 0.0, 0.0))  # ローカルX軸
             solid_placement = ifc_file.createIfcAxis2Placement3D(
                 Location=relative_base_location,
                 Axis=relative_axis,
@@ -236,7 +278,7 @@ class WallCreator(PlanarElementCreator):
             )
 
             # ExtrudedAreaSolidを作成（押し出し方向はローカルZ軸）
-            extrusion_vector = ifc_file.createIfcDirection([0.0, 0.0, 1.0])
+            extrusion_vector = self._get_direction((0.0, 0.0, 1.0))
             solid = ifc_file.createIfcExtrudedAreaSolid(
                 SweptArea=profile,
                 Position=solid_placement,
@@ -246,7 +288,7 @@ class WallCreator(PlanarElementCreator):
 
             # 開口部処理（旧版の実装を統合）
             if openings:
-                self.logger.info(f"壁に{len(openings)}個の開口部を処理します")
+                self.logger.info("壁に%d個の開口部を処理します", len(openings))
 
             return solid, local_coord
 
@@ -254,7 +296,42 @@ class WallCreator(PlanarElementCreator):
             self.logger.error(f"壁ジオメトリ作成エラー: {e}")
             return None, None
 
-    def _create_placement(self, reference_point: Point3D, local_coord: dict = None):
+    def _create_wall_profile(self, profile_points: List[tuple]):
+        """壁の2Dプロファイルを作成
+
+        矩形の場合はIfcRectangleProfileDef（中心にPositionを配置）、
+        それ以外はポリラインによるIfcArbitraryClosedProfileDefを作成する。
+
+        Args:
+            profile_points: ローカル座標系の (x, y) タプルの配列
+        """
+        ifc_file = self.project_builder.file
+
+        bounds = calculate_rectangle_bounds(profile_points)
+        if bounds is not None:
+            min_x, min_y, max_x, max_y = bounds
+            position = ifc_file.createIfcAxis2Placement2D(
+                Location=self._get_cartesian_point(
+                    ((min_x + max_x) / 2.0, (min_y + max_y) / 2.0)
+                )
+            )
+            return ifc_file.createIfcRectangleProfileDef(
+                ProfileType="AREA",
+                Position=position,
+                XDim=max_x - min_x,
+                YDim=max_y - min_y,
+            )
+
+        mk_pt = ifc_file.createIfcCartesianPoint
+        ifc_points = [mk_pt(p) for p in profile_points]
+        polyline = ifc_file.createIfcPolyLine(ifc_points + [ifc_points[0]])
+        return ifc_file.createIfcArbitraryClosedProfileDef(
+            ProfileType="AREA", OuterCurve=polyline
+        )
+
+    def _create_placement(
+        self, reference_point: Point3D, local_coord: Optional[FaceBasis] = None
+    ):
         """配置を作成（面の法線方向を考慮）"""
         try:
             if not self.project_builder or not self.project_builder.file:
@@ -274,8 +351,8 @@ class WallCreator(PlanarElementCreator):
             # 面の法線方向を考慮した配置
             if local_coord:
                 # 面の法線と参照方向を使用した正確な配置
-                axis_direction = ifc_file.createIfcDirection(local_coord["z_axis"])
-                ref_direction = ifc_file.createIfcDirection(local_coord["x_axis"])
+                axis_direction = self._get_direction(local_coord.z_axis)
+                ref_direction = self._get_direction(local_coord.x_axis)
                 
                 placement = ifc_file.createIfcAxis2Placement3D(
                     Location=location,
@@ -317,8 +394,6 @@ class WallCreator(PlanarElementCreator):
             ifc_file = self.project_builder.file
 
             # GUIDを生成または変換
-            from common.guid_utils import convert_stb_guid_to_ifc, create_ifc_guid
-
             try:
                 if stb_guid:
                     element_guid = convert_stb_guid_to_ifc(stb_guid)
@@ -356,7 +431,7 @@ class WallCreator(PlanarElementCreator):
             )
 
             # 壁作成完了をデバッグログに記録
-            logger.debug(f"壁を作成しました: 名前={wall_name}, GUID={element_guid}")
+            logger.debug("壁を作成しました: 名前=%s, GUID=%s", wall_name, element_guid)
             return wall
 
         except Exception as e:
@@ -379,145 +454,156 @@ class WallCreator(PlanarElementCreator):
         if not corner_points:
             raise ValueError("角点リストが空です")
         
-        center_x = sum(point.x for point in corner_points) / len(corner_points)
-        center_y = sum(point.y for point in corner_points) / len(corner_points) 
-        center_z = sum(point.z for point in corner_points) / len(corner_points)
-        
-        return Point3D(center_x, center_y, center_z)
+        return Point3D(*self._centroid(self._points_to_xyz(corner_points)))
+
+    @staticmethod
+    def _centroid(points_xyz: List[tuple]) -> tuple:
+        """(x, y, z) タプル配列の重心を計算"""
+        num_points = len(points_xyz)
+        xs, ys, zs = zip(*points_xyz)
+        return (sum(xs) / num_points, sum(ys) / num_points, sum(zs) / num_points)
+
+    @staticmethod
+    def _points_to_xyz(points: List[Point3D]) -> List[tuple]:
+        """Point3Dのリストを (x, y, z) タプルの配列に変換"""
+        return [(point.x, point.y, point.z) for point in points]
+
+    @staticmethod
+    def _corner_xyz(corner_nodes) -> List[tuple]:
+        """角点辞書のリストから (x, y, z) タプルの配列を取り出す"""
+        if not corner_nodes or not isinstance(corner_nodes, list):
+            return []
+        return [_xyz(node) for node in corner_nodes if isinstance(node, dict)]
 
     def create_walls(self, wall_definitions: list) -> list:
         """複数の壁を作成"""
         return self.create_elements(wall_definitions)
 
     def _create_face_local_coordinate_system(
-        self, ordered_nodes: list, center_point: dict = None
-    ) -> dict:
-        """面のローカル座標系（正規直交基底）を作成"""
-        if len(ordered_nodes) < 3:
+        self, nodes_xyz: list, origin_xyz: Optional[tuple] = None
+    ) -> FaceBasis:
+        """面のローカル座標系（正規直交基底）を作成
+
+        Args:
+            nodes_xyz: 面の節点の (x, y, z) タプル配列（順序付き）
+            origin_xyz: 原点とする (x, y, z)（オプション）
+        """
+        if len(nodes_xyz) < 3:
             raise ValueError("ローカル座標系の作成には最低3つの節点が必要です")
 
-        # 原点は指定されたcenter_pointを使用、なければ重心を計算
-        if center_point:
-            origin = [center_point["x"], center_point["y"], center_point["z"]]
+        # 原点は指定された座標を使用、なければ重心を計算
+        if origin_xyz is not None:
+            origin = tuple(origin_xyz)
         else:
             # 全節点の重心を原点として使用
-            origin = [
-                sum(n["x"] for n in ordered_nodes) / len(ordered_nodes),
-                sum(n["y"] for n in ordered_nodes) / len(ordered_nodes),
-                sum(n["z"] for n in ordered_nodes) / len(ordered_nodes),
-            ]
+            origin = self._centroid(nodes_xyz)
 
-        # 1. Z軸: 面の法線 (Newellのアルゴリズムで計算)
-        z_axis = self._calculate_face_normal(ordered_nodes)
-
-        # 2. Y軸: Z軸と直交するY軸を計算
-        # 最初の2節点から仮のX軸を決定
-        p0 = ordered_nodes[0]
-        p1 = ordered_nodes[1]
-        temp_x = [p1["x"] - p0["x"], p1["y"] - p0["y"], p1["z"] - p0["z"]]
-
-        # Y = Z x temp_X
-        y_axis = [
-            z_axis[1] * temp_x[2] - z_axis[2] * temp_x[1],
-            z_axis[2] * temp_x[0] - z_axis[0] * temp_x[2],
-            z_axis[0] * temp_x[1] - z_axis[1] * temp_x[0],
-        ]
-        y_len = math.sqrt(sum(y * y for y in y_axis))
-
-        # 仮X軸がZ軸と平行だった場合のフォールバック
-        if y_len < 1e-9:
-            self.logger.debug(f"Y軸計算でフォールバック処理を実行（y_len={y_len:.2e}）")
-            # 仮のベクトルとしてグローバルX軸を使用
-            temp_up = [1.0, 0.0, 0.0]
-            # Z軸がグローバルX軸と平行な場合はグローバルY軸を使用
-            if abs(abs(sum(t * z for t, z in zip(temp_up, z_axis))) - 1.0) < 1e-9:
-                temp_up = [0.0, 1.0, 0.0]
-                self.logger.debug("グローバルY軸をフォールバック参照として使用")
-
-            # Y = Z x temp_up
-            y_axis = [
-                z_axis[1] * temp_up[2] - z_axis[2] * temp_up[1],
-                z_axis[2] * temp_up[0] - z_axis[0] * temp_up[2],
-                z_axis[0] * temp_up[1] - z_axis[1] * temp_up[0],
-            ]
-            y_len = math.sqrt(sum(y * y for y in y_axis))
-            
-            if y_len < 1e-9:
-                self.logger.warning("フォールバック処理でもY軸計算に失敗。デフォルト座標系を使用")
-                return {"origin": origin, "x_axis": [1.0, 0.0, 0.0], "y_axis": [0.0, 1.0, 0.0], "z_axis": [0.0, 0.0, 1.0]}
-
-        y_axis = [y / y_len for y in y_axis]
+        # 鉛直な矩形壁は閉形式で基底を決定（Newell法を省略）
+        vertical_axes = calculate_vertical_face_axes(nodes_xyz)
+        if vertical_axes is not None:
+            return FaceBasis(origin, *vertical_axes)
 
-        # 3. X軸: Y軸とZ軸から、直交するX軸を再計算 (X = Y x Z)
-        x_axis = [
-            y_axis[1] * z_axis[2] - y_axis[2] * z_axis[1],
-            y_axis[2] * z_axis[0] - y_axis[0] * z_axis[2],
-            y_axis[0] * z_axis[1] - y_axis[1] * z_axis[0],
-        ]
+        # 1. Z軸: 面の法線 (Newellのアルゴリズムで計算)
+        z_axis = self._calculate_face_normal(nodes_xyz)
+
+        # 2-3. Y軸・X軸: Z軸と直交する基底を計算
+        axes = calculate_face_axes(nodes_xyz, z_axis)
+        if axes is None:
+            self.logger.warning("フォールバック処理でもY軸計算に失敗。デフォルト座標系を使用")
+            return FaceBasis(
+                origin, (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)
+            )
+        x_axis, y_axis = axes
 
-        return {"origin": origin, "x_axis": x_axis, "y_axis": y_axis, "z_axis": z_axis}
+        return FaceBasis(origin, x_axis, y_axis, z_axis)
 
     def _calculate_face_normal(self, nodes: list) -> list:
-        """面の法線ベクトルを計算（Newellのアルゴリズムを使用）"""
+        """面の法線ベクトルを計算（Newellのアルゴリズムを使用）
+
+        Args:
+            nodes: (x, y, z) タプルの配列
+        """
         if len(nodes) < 3:
             return [0.0, 0.0, 1.0]
 
-        normal = [0.0, 0.0, 0.0]
-        num_nodes = len(nodes)
-
-        for i in range(num_nodes):
-            p1 = nodes[i]
-            p2 = nodes[(i + 1) % num_nodes]
-
-            normal[0] += (p1["y"] - p2["y"]) * (p1["z"] + p2["z"])
-            normal[1] += (p1["z"] - p2["z"]) * (p1["x"] + p2["x"])
-            normal[2] += (p1["x"] - p2["x"]) * (p1["y"] + p2["y"])
-
-        length = math.sqrt(sum(n * n for n in normal))
-        if length > 1e-9:
-            normal = [n / length for n in normal]
-        else:
+        normal = calculate_face_normal(nodes)
+        if normal is None:
             self.logger.warning(
-                f"法線ベクトルの計算に失敗しました（長さ={length:.2e}）。デフォルト値Z軸を使用します。"
+                "法線ベクトルの計算に失敗しました（面が退化しています）。デフォルト値Z軸を使用します。"
             )
             return [0.0, 0.0, 1.0]
 
         return normal
 
-    def _transform_to_local_2d(self, node: dict, coord_system: dict) -> tuple:
-        """3D点をローカル座標系の2D座標に変換"""
-        # 原点からの相対ベクトル
-        vec = [
-            node["x"] - coord_system["origin"][0],
-            node["y"] - coord_system["origin"][1],
-            node["z"] - coord_system["origin"][2],
-        ]
+    @staticmethod
+    def _project_to_local_2d(points: list, coord_system: FaceBasis) -> list:
+        """3D点群をローカル座標系の2D座標にまとめて変換
 
-        # ローカルX, Y座標を計算
-        local_x = sum(v * x for v, x in zip(vec, coord_system["x_axis"]))
-        local_y = sum(v * y for v, y in zip(vec, coord_system["y_axis"]))
+        Args:
+            points: (x, y, z) タプルの配列
+            coord_system: ローカル座標系
 
-        return (local_x, local_y)
+        Returns:
+            (local_x, local_y) タプルのリスト
+        """
+        (ox, oy, oz), (xx, xy, xz), (yx, yy, yz), _ = coord_system
+
+        profile_points = []
+        for x, y, z in points:
+            # 原点からの相対ベクトルをX軸・Y軸へ射影
+            dx, dy, dz = x - ox, y - oy, z - oz
+            profile_points.append(
+                (dx * xx + dy * xy + dz * xz, dx * yx + dy * yy + dz * yz)
+            )
+        return profile_points
 
     def _create_wall_openings(
         self,
         wall,
         openings: List[Dict],
-        wall_section: StructuralSection,
-        local_coord: dict,
+        wall_thickness: float,
+        wall_length: float,
+        wall_height: float,
+        local_coord: FaceBasis,
     ):
         """壁の開口要素を作成（STBローカル座標系に対応）
 
         Args:
             wall: IFC壁オブジェクト
             openings: 開口情報のリスト
-            wall_section: 壁の断面情報
+            wall_thickness: 壁の厚さ
+            wall_length: 壁の長さ
+            wall_height: 壁の高さ
             local_coord: 壁のローカル座標系
         """
         if not self.project_builder or not self.project_builder.file:
             return
         
         ifc_file = self.project_builder.file
+        owner = self.project_builder.owner_history
+        ctx = self.project_builder.model_context
+
+        # 壁を確実に貫通させるため、押し出し開始位置をオフセットし、深さを調整
+        epsilon = 1.0  # 1mmのクリアランス
+        opening_depth = wall_thickness + (2 * epsilon)  # 壁厚より長くして確実に貫通
+
+        # 開口の配置方向（壁のローカル座標系に合わせる）
+        # 開口の押し出し方向は壁の厚さ方向（壁のローカルZ軸）
+        opening_axis = self._get_direction((0.0, 0.0, 1.0))  # Z軸（厚さ方向）
+        opening_ref = self._get_direction((1.0, 0.0, 0.0))  # X軸（長手方向）
+
+        # 押し出し方向（開口ジオメトリのローカルZ軸方向）
+        extrusion_direction = opening_axis
+
+        # 同一寸法の開口はプロファイル・押し出しソリッドを共有する
+        # （ソリッドは開口ローカル座標で定義されるため配置に依存しない）
+        profile_cache = self._get_entity_cache("OpeningProfile")
+        solid_cache = self._get_entity_cache("OpeningSolid")
+
+        # ループ内で繰り返し使うエンティティ生成メソッドを束縛
+        mk_pt = ifc_file.createIfcCartesianPoint
+        mk_axis_placement = ifc_file.createIfcAxis2Placement3D
+        mk_local_placement = ifc_file.createIfcLocalPlacement
 
         for opening_data in openings:
             try:
@@ -530,27 +616,12 @@ class WallCreator(PlanarElementCreator):
                 width = float(dimensions.get("width", 1000))  # mm
                 height = float(dimensions.get("height", 2000))  # mm
 
-                # 壁の厚さを取得
-                wall_thickness = wall_section.properties.get("thickness", 250.0)
-
-                # 開口の形状を作成（矩形）
-                opening_profile = ifc_file.createIfcRectangleProfileDef(
-                    ProfileType="AREA",
-                    ProfileName=f"Opening_{opening_id}",
-                    XDim=width,
-                    YDim=height,
-                )
-
                 # STBの相対位置を取得（壁の最初の節点を基準とした座標）
                 # position_X: 壁の長手方向のオフセット
                 # position_Y: 壁の高さ方向（Z軸）のオフセット
                 rel_x = float(relative_position.get("x", 0))  # 長手方向オフセット
                 rel_z = float(relative_position.get("y", 0))  # 高さ方向オフセット
 
-                # 壁の寸法を取得
-                wall_length = wall_section.properties.get("length", 6000.0)  # 壁の長さ
-                wall_height = wall_section.properties.get("height", 4500.0)  # 壁の高さ
-
                 # STB座標からIFC中心基準座標への変換
                 # position_X, position_Yは左下角からのオフセット
                 # 壁の中心を基準とした座標に変換
@@ -565,60 +636,61 @@ class WallCreator(PlanarElementCreator):
                 local_z = 0.0  # Zが厚さ方向の中心
 
                 # 開口の配置位置（壁のローカル座標系）
-                opening_location = ifc_file.createIfcCartesianPoint(
-                    [local_x, local_y, local_z]
-                )
-
-                # 開口の配置方向（壁のローカル座標系に合わせる）
-                # 開口の押し出し方向は壁の厚さ方向（壁のローカルZ軸）
-                opening_axis = ifc_file.createIfcDirection(
-                    [0.0, 0.0, 1.0]
-                )  # Z軸（厚さ方向）
-                opening_ref = ifc_file.createIfcDirection(
-                    [1.0, 0.0, 0.0]
-                )  # X軸（長手方向）
+                opening_location = mk_pt([local_x, local_y, local_z])
 
-                opening_placement_3d = ifc_file.createIfcAxis2Placement3D(
+                opening_placement_3d = mk_axis_placement(
                     Location=opening_location,
                     Axis=opening_axis,
                     RefDirection=opening_ref,
                 )
 
                 # 壁に対する相対配置として設定
-                opening_local_placement = ifc_file.createIfcLocalPlacement(
+                opening_local_placement = mk_local_placement(
                     PlacementRelTo=wall.ObjectPlacement,  # 壁の配置を基準とする
                     RelativePlacement=opening_placement_3d,
                 )
 
-                # 押し出し方向（開口ジオメトリのローカルZ軸方向）
-                extrusion_direction = ifc_file.createIfcDirection([0.0, 0.0, 1.0])
-
-                # 壁を確実に貫通させるため、押し出し開始位置をオフセットし、深さを調整
-                epsilon = 1.0  # 1mmのクリアランス
-
-                # 開口の押し出しソリッドの配置
-                # 壁の厚さの中心から前後にepsilonずつオフセット
-                solid_placement = ifc_file.createIfcAxis2Placement3D(
-                    Location=ifc_file.createIfcCartesianPoint(
-                        [
-                            0.0,  # X軸方向のオフセットなし
-                            0.0,  # Y軸方向のオフセットなし
-                            -wall_thickness / 2.0 - epsilon,  # Z軸方向にオフセット
-                        ]
+                # 開口の3Dジオメトリ（押し出しソリッド）
+                profile_key = (round(width, 3), round(height, 3))
+                solid_key = profile_key + (round(wall_thickness, 3),)
+                opening_solid = solid_cache.get(solid_key)
+                if opening_solid is None:
+                    # 開口の形状を作成（矩形）
+                    opening_profile = profile_cache.get(profile_key)
+                    if opening_profile is None:
+                        opening_profile = profile_cache[profile_key] = (
+                            ifc_file.createIfcRectangleProfileDef(
+                                ProfileType="AREA",
+                                ProfileName=f"Opening_{width}x{height}",
+                                XDim=width,
+                                YDim=height,
+                            )
+                        )
+
+                    # 開口の押し出しソリッドの配置
+                    # 壁の厚さの中心から前後にepsilonずつオフセット
+                    solid_placement = mk_axis_placement(
+                        Location=self._get_cartesian_point(
+                            (
+                                0.0,  # X軸方向のオフセットなし
+                                0.0,  # Y軸方向のオフセットなし
+                                -wall_thickness / 2.0 - epsilon,  # Z軸方向にオフセット
+                            )
+                        )
                     )
-                )
 
-                # 開口の3Dジオメトリ（押し出しソリッド）
-                opening_solid = ifc_file.createIfcExtrudedAreaSolid(
-                    SweptArea=opening_profile,
-                    Position=solid_placement,
-                    ExtrudedDirection=extrusion_direction,
-                    Depth=wall_thickness + (2 * epsilon),  # 壁厚より長くして確実に貫通
-                )
+                    opening_solid = solid_cache[solid_key] = (
+                        ifc_file.createIfcExtrudedAreaSolid(
+                            SweptArea=opening_profile,
+                            Position=solid_placement,
+                            ExtrudedDirection=extrusion_direction,
+                            Depth=opening_depth,
+                        )
+                    )
 
                 # 形状表現
                 opening_shape_rep = ifc_file.createIfcShapeRepresentation(
-                    ContextOfItems=self.project_builder.model_context,
+                    ContextOfItems=ctx,
                     RepresentationIdentifier="Body",
                     RepresentationType="SweptSolid",
                     Items=[opening_solid],
@@ -629,13 +701,12 @@ class WallCreator(PlanarElementCreator):
                 )
 
                 # GUIDを生成
-                from common.guid_utils import create_ifc_guid
                 opening_guid = create_ifc_guid()
 
                 # 開口要素を作成
                 opening_element = ifc_file.createIfcOpeningElement(
                     GlobalId=opening_guid,
-                    OwnerHistory=self.project_builder.owner_history,
+                    OwnerHistory=owner,
                     Name=f"Opening_{opening_id}",
                     Description=f"Wall opening from STB id={opening_id}",
                     ObjectPlacement=opening_local_placement,
@@ -646,7 +717,7 @@ class WallCreator(PlanarElementCreator):
                 rel_voids_guid = create_ifc_guid()
                 rel_voids = ifc_file.createIfcRelVoidsElement(
                     GlobalId=rel_voids_guid,
-                    OwnerHistory=self.project_builder.owner_history,
+                    OwnerHistory=owner,
                     Name=f"WallVoiding_{opening_id}",
                     Description=f"Voiding relationship for opening {opening_id}",
                     RelatingBuildingElement=wall,
@@ -654,15 +725,16 @@ class WallCreator(PlanarElementCreator):
                 )
 
                 self.logger.debug(
-                    f"開口 {opening_id} を作成: 幅={width}mm, 高さ={height}mm, "
-                    f"STB位置=({rel_x}, {rel_z}), 中心オフセット=({center_offset_x:.1f}, {center_offset_z:.1f}), "
-                    f"最終ローカル位置=({local_x:.1f}, {local_y:.1f}, {local_z:.1f})"
+                    "開口 %s を作成: 幅=%smm, 高さ=%smm, "
+                    "STB位置=(%s, %s), 中心オフセット=(%.1f, %.1f), "
+                    "最終ローカル位置=(%.1f, %.1f, %.1f)",
+                    opening_id, width, height,
+                    rel_x, rel_z, center_offset_x, center_offset_z,
+                    local_x, local_y, local_z,
                 )
 
             except Exception as e:
-                self.logger.error(
-                    f"開口 {opening_data.get('id', 'Unknown')} の作成に失敗: {e}"
+                self.logger.exception(
+                    "開口 %s の作成に失敗: %s", opening_data.get("id", "Unknown"), e
                 )
-                import traceback
-                traceback.print_exc()
                 continue
@@ -0,0 +1,185 @@
+"""Face Geometry
+
+面要素（壁など）のローカル座標系計算
+Creatorの状態に依存しない数値計算のみを提供
+"""
+
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# (x, y, z) 座標タプル
+Vector3 = Sequence[float]
+
+
+class FaceBasis(NamedTuple):
+    """面のローカル座標系（原点と正規直交基底）"""
+
+    origin: Vector3
+    x_axis: Vector3
+    y_axis: Vector3
+    z_axis: Vector3
+
+
+def calculate_face_normal(nodes: Sequence[Vector3]) -> Optional[List[float]]:
+    """面の単位法線ベクトルを計算（Newellのアルゴリズム）
+
+    Args:
+        nodes: (x, y, z) タプルの配列（3点以上）
+
+    Returns:
+        単位法線ベクトル。面が退化している場合はNone
+    """
+    nx = ny = nz = 0.0
+    for (x1, y1, z1), (x2, y2, z2) in zip(nodes, nodes[1:] + nodes[:1]):
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+
+    length = math.sqrt(nx * nx + ny * ny + nz * nz)
+    if length <= 1e-9:
+        return None
+    return [nx / length, ny / length, nz / length]
+
+
+def calculate_face_axes(
+    nodes: Sequence[Vector3], z_axis: Vector3
+) -> Optional[Tuple[List[float], List[float]]]:
+    """法線（ローカルZ軸）に直交するローカルX軸・Y軸を計算
+
+    最初の辺を仮のX軸とし、法線と平行な場合はグローバルX軸（またはY軸）を
+    参照に用いる。
+
+    Args:
+        nodes: (x, y, z) タプルの配列（2点以上）
+        z_axis: 単位法線ベクトル
+
+    Returns:
+        (x_axis, y_axis)。直交基底が得られない場合はNone
+    """
+    zx, zy, zz = z_axis
+
+    # 最初の2節点から仮のX軸を決定
+    (x0, y0, z0), (x1, y1, z1) = nodes[0], nodes[1]
+    tx, ty, tz = x1 - x0, y1 - y0, z1 - z0
+
+    # Y = Z x temp_X
+    yx, yy, yz = zy * tz - zz * ty, zz * tx - zx * tz, zx * ty - zy * tx
+    y_len = math.sqrt(yx * yx + yy * yy + yz * yz)
+
+    # 仮X軸がZ軸と平行だった場合のフォールバック
+    if y_len < 1e-9:
+        # 仮のベクトルとしてグローバルX軸を使用
+        # Z軸がグローバルX軸と平行な場合はグローバルY軸を使用
+        if abs(abs(zx) - 1.0) < 1e-9:
+            tx, ty, tz = 0.0, 1.0, 0.0
+        else:
+            tx, ty, tz = 1.0, 0.0, 0.0
+
+        # Y = Z x temp_up
+        yx, yy, yz = zy * tz - zz * ty, zz * tx - zx * tz, zx * ty - zy * tx
+        y_len = math.sqrt(yx * yx + yy * yy + yz * yz)
+
+        if y_len < 1e-9:
+            return None
+
+    yx, yy, yz = yx / y_len, yy / y_len, yz / y_len
+
+    # X軸: Y軸とZ軸から、直交するX軸を再計算 (X = Y x Z)
+    x_axis = [yy * zz - yz * zy, yz * zx - yx * zz, yx * zy - yy * zx]
+
+    return x_axis, [yx, yy, yz]
+
+
+def calculate_vertical_face_axes(
+    nodes: Sequence[Vector3], tolerance: float = 1e-6
+) -> Optional[Tuple[List[float], List[float], List[float]]]:
+    """鉛直な矩形面（一般的な壁）のローカル座標系を閉形式で計算
+
+    節点順序が 下辺(p0→p1) → 上辺(p2→p3) で、p2・p3がそれぞれp1・p0の
+    真上（または真下）にある場合のみ対象とする。結果は
+    calculate_face_normal / calculate_face_axes と一致する。
+
+    Args:
+        nodes: (x, y, z) タプルの配列
+        tolerance: 座標比較の許容誤差
+
+    Returns:
+        (x_axis, y_axis, z_axis)。対象外の形状の場合はNone
+    """
+    if len(nodes) != 4:
+        return None
+
+    (x0, y0, z0), (x1, y1, z1), (x2, y2, z2), (x3, y3, z3) = nodes
+
+    # 下辺・上辺が水平で、上下の高さが異なること
+    height = z3 - z0
+    if (
+        abs(z1 - z0) > tolerance
+        or abs(z2 - z3) > tolerance
+        or abs(height) <= tolerance
+    ):
+        return None
+
+    # 上辺の節点が下辺の節点の鉛直線上にあること
+    if (
+        abs(x2 - x1) > tolerance
+        or abs(y2 - y1) > tolerance
+        or abs(x3 - x0) > tolerance
+        or abs(y3 - y0) > tolerance
+    ):
+        return None
+
+    dx, dy = x1 - x0, y1 - y0
+    length = math.hypot(dx, dy)
+    if length <= tolerance:
+        return None
+
+    # X軸: 下辺方向、Y軸: 鉛直（上辺側）、Z軸: X x Y
+    ux, uy = dx / length, dy / length
+    up = 1.0 if height > 0 else -1.0
+    return [ux, uy, 0.0], [0.0, 0.0, up], [uy * up, -ux * up, 0.0]
+
+
+def calculate_rectangle_bounds(
+    points_2d: Sequence[Sequence[float]], tolerance: float = 1e-6
+) -> Optional[Tuple[float, float, float, float]]:
+    """2D多角形が軸に平行な矩形の場合、その範囲を計算
+
+    4点で、各辺が交互にX軸・Y軸に平行な場合のみ矩形とみなす。
+
+    Args:
+        points_2d: (x, y) タプルの配列
+        tolerance: 座標比較の許容誤差
+
+    Returns:
+        (min_x, min_y, max_x, max_y)。矩形でない場合はNone
+    """
+    if len(points_2d) != 4:
+        return None
+
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points_2d
+
+    # 最初の辺が水平（X軸平行）か鉛直（Y軸平行）かで判定を切り替える
+    if abs(y1 - y0) <= tolerance:
+        is_rectangle = (
+            abs(x2 - x1) <= tolerance
+            and abs(y3 - y2) <= tolerance
+            and abs(x0 - x3) <= tolerance
+        )
+    elif abs(x1 - x0) <= tolerance:
+        is_rectangle = (
+            abs(y2 - y1) <= tolerance
+            and abs(x3 - x2) <= tolerance
+            and abs(y0 - y3) <= tolerance
+        )
+    else:
+        return None
+
+    if not is_rectangle:
+        return None
+
+    min_x, max_x = min(x0, x1, x2, x3), max(x0, x1, x2, x3)
+    min_y, max_y = min(y0, y1, y2, y3), max(y0, y1, y2, y3)
+    if max_x - min_x <= tolerance or max_y - min_y <= tolerance:
+        return None
+    return min_x, min_y, max_x, max_y
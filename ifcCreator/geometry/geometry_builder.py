@@ -1,51 +0,0 @@
-"""Geometry Builder
-
-v2.2.0 統合ジオメトリビルダー
-全ジオメトリ処理を統合
-"""
-
-from typing import Any, Optional, Dict
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class GeometryBuilder:
-    """統合ジオメトリビルダー
-    
-    v2.2.0: 全ジオメトリ処理を統一
-    """
-    
-    def __init__(self, project_builder=None):
-        self.project_builder = project_builder
-        self.logger = logger
-        
-    def create_linear_geometry(self, start_point, end_point, section) -> Optional[Any]:
-        """線要素ジオメトリを作成"""
-        # 統合実装 - 既存LinearGeometryBuilderの機能
-        return None
-    
-    def create_planar_geometry(self, points, section) -> Optional[Any]:
-        """面要素ジオメトリを作成"""
-        # 統合実装 - 既存PlanarGeometryBuilderの機能
-        return None
-    
-    def create_beam_geometry(self, start_point, end_point, start_section, end_section=None) -> Optional[Any]:
-        """梁ジオメトリを作成"""
-        # 統合実装
-        return None
-    
-    def create_column_geometry(self, bottom_point, top_point, bottom_section, top_section=None) -> Optional[Any]:
-        """柱ジオメトリを作成"""
-        # 統合実装
-        return None
-    
-    def create_slab_geometry(self, outline_points, thickness) -> Optional[Any]:
-        """スラブジオメトリを作成"""
-        # 統合実装
-        return None
-    
-    def create_wall_geometry(self, base_line, height, thickness) -> Optional[Any]:
-        """壁ジオメトリを作成"""
-        # 統合実装
-        return None
\ No newline at end of file
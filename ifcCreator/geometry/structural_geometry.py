@@ -3,7 +3,8 @@
 統合された構造要素幾何学計算モジュール
 """
 import math
-from typing import List, Literal
+from functools import lru_cache
+from typing import List, Literal, NamedTuple, Tuple
 from dataclasses import dataclass
 from common.geometry import Point3D
 
@@ -11,7 +12,7 @@ from common.geometry import Point3D
 ElementType = Literal["BEAM", "COLUMN", "BRACE"]
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuralElementGeometry:
     """構造要素の幾何学的情報（梁・柱統合版）"""
 
@@ -32,6 +33,19 @@ class StructuralElementGeometry:
         return self.span
 
 
+class StructuralPlacement(NamedTuple):
+    """構造要素の精密配置情報（GeometryService.create_structural_placementの結果）"""
+
+    origin: Point3D
+    direction: List[float]
+    ref_direction: List[float]
+    length: float
+    element_type: ElementType
+
+    # 作成元（全インスタンス共通のメタ情報）
+    created_by = "GeometryService v2.2.0 Phase1-Enhanced"
+
+
 class StructuralGeometryCalculator:
     """構造要素の幾何学計算責務（梁・柱統合版）"""
 
@@ -40,66 +54,38 @@ class StructuralGeometryCalculator:
         start: Point3D, end: Point3D
     ) -> StructuralElementGeometry:
         """梁の幾何学情報を計算"""
-        geometry = StructuralGeometryCalculator._calculate_base_geometry(
+        # 参照方向は梁固有の計算（要素タイプから決定）
+        return StructuralGeometryCalculator._calculate_base_geometry(
             start, end, "BEAM"
         )
 
-        # 梁固有の参照方向計算
-        geometry.reference_direction = (
-            StructuralGeometryCalculator._calculate_beam_reference_direction(
-                geometry.direction
-            )
-        )
-
-        return geometry
-
     @staticmethod
     def calculate_column_geometry(
         bottom: Point3D, top: Point3D
     ) -> StructuralElementGeometry:
         """柱の幾何学情報を計算"""
-        geometry = StructuralGeometryCalculator._calculate_base_geometry(
+        # 参照方向は柱固有の計算（要素タイプから決定）
+        return StructuralGeometryCalculator._calculate_base_geometry(
             bottom, top, "COLUMN"
         )
 
-        # 柱固有の参照方向計算
-        geometry.reference_direction = (
-            StructuralGeometryCalculator._calculate_column_reference_direction(
-                geometry.direction
-            )
-        )
-
-        return geometry
-
     @staticmethod
     def calculate_brace_geometry(
         start: Point3D, end: Point3D
     ) -> StructuralElementGeometry:
         """ブレースの幾何学情報を計算"""
-        geometry = StructuralGeometryCalculator._calculate_base_geometry(
+        # 参照方向はブレース固有の計算（要素タイプから決定）
+        return StructuralGeometryCalculator._calculate_base_geometry(
             start, end, "BRACE"
         )
 
-        # ブレース固有の参照方向計算
-        geometry.reference_direction = (
-            StructuralGeometryCalculator._calculate_brace_reference_direction(
-                geometry.direction
-            )
-        )
-
-        return geometry
-
     @staticmethod
     def _calculate_base_geometry(
         start: Point3D, end: Point3D, element_type: ElementType
     ) -> StructuralElementGeometry:
         """基本幾何学情報を計算（共通ロジック）"""
-        dx, dy, dz = end.x - start.x, end.y - start.y, end.z - start.z
-        span = math.sqrt(dx * dx + dy * dy + dz * dz)
-
-        center = Point3D(
-            (start.x + end.x) / 2, (start.y + end.y) / 2, (start.z + end.z) / 2
-        )
+        cx, cy, cz, span, nx, ny, nz = _base_kernel(*start.xyz, *end.xyz)
+        center = Point3D(cx, cy, cz)
 
         # デフォルト方向の設定
         if element_type == "BEAM":
@@ -109,82 +95,145 @@ class StructuralGeometryCalculator:
         else:  # COLUMN
             default_direction = [0.0, 0.0, 1.0]  # 柱のデフォルト
 
-        direction = [dx / span, dy / span, dz / span] if span > 0 else default_direction
+        direction = [nx, ny, nz] if span > 0 else default_direction
+
+        # 要素タイプ固有の参照方向を構築時に決定（仮の値を作らない）
+        reference_direction_of = _REFERENCE_DIRECTION_FUNCTIONS.get(
+            element_type, _beam_reference_direction
+        )
 
         return StructuralElementGeometry(
             center=center,
             span=span,
             direction=direction,
-            reference_direction=[1.0, 0.0, 0.0],  # 一時的、後で更新
+            reference_direction=list(reference_direction_of(tuple(direction))),
             element_type=element_type,
         )
 
     @staticmethod
     def _calculate_beam_reference_direction(beam_direction: List[float]) -> List[float]:
         """梁の参照方向を計算（断面の向きを決定）"""
-        # 梁が鉛直（Z軸方向）の場合
-        if abs(beam_direction[0]) < 1e-6 and abs(beam_direction[1]) < 1e-6:
-            return [1.0, 0.0, 0.0]
-
-        # 水平梁の場合、常にZ軸を断面のY軸とするための参照方向を計算
-        ref_x = -beam_direction[1]
-        ref_y = beam_direction[0]
-        ref_z = 0.0
-
-        # ベクトルの正規化
-        length = math.sqrt(ref_x * ref_x + ref_y * ref_y + ref_z * ref_z)
-        if length > 1e-6:
-            return [ref_x / length, ref_y / length, ref_z / length]
-        else:
-            return [1.0, 0.0, 0.0]
+        return list(_beam_reference_direction(tuple(beam_direction)))
 
     @staticmethod
     def _calculate_column_reference_direction(
         column_direction: List[float],
     ) -> List[float]:
         """柱の参照方向を計算（断面の向きを決定）"""
-        # 鉛直柱（Z軸方向）の場合
-        if abs(column_direction[2]) > 0.9:  # ほぼ鉛直
-            return [1.0, 0.0, 0.0]
-
-        # 傾斜柱の場合、柱軸と重力方向に垂直な方向を求める
-        ref_x = -column_direction[1]
-        ref_y = column_direction[0]
-        ref_z = 0.0
-
-        # ベクトルの正規化
-        length = math.sqrt(ref_x * ref_x + ref_y * ref_y + ref_z * ref_z)
-        if length > 1e-6:
-            return [ref_x / length, ref_y / length, ref_z / length]
-        else:
-            return [1.0, 0.0, 0.0]
+        return list(_column_reference_direction(tuple(column_direction)))
 
     @staticmethod
     def _calculate_brace_reference_direction(
         brace_direction: List[float],
     ) -> List[float]:
         """ブレースの参照方向を計算（断面の向きを決定）"""
-        # ブレースは一般的に斜め要素なので、重力方向（Z軸）に垂直な
-        # 最も近い水平方向を参照方向とする
-
-        # ブレースが完全に水平の場合
-        if abs(brace_direction[2]) < 1e-6:
-            # Y軸方向を参照とする
-            return [0.0, 1.0, 0.0]
-
-        # ブレースが完全に鉛直の場合
-        if abs(brace_direction[0]) < 1e-6 and abs(brace_direction[1]) < 1e-6:
-            return [1.0, 0.0, 0.0]
-
-        # 一般的な斜めブレースの場合、ブレース軸と鉛直方向に垂直な
-        # 水平方向を計算
-        ref_x = -brace_direction[1]
-        ref_y = brace_direction[0]
-        ref_z = 0.0
-
-        # ベクトルの正規化
-        length = math.sqrt(ref_x * ref_x + ref_y * ref_y + ref_z * ref_z)
-        if length > 1e-6:
-            return [ref_x / length, ref_y / length, ref_z / length]
-        else:
-            return [1.0, 0.0, 0.0]
+        return list(_brace_reference_direction(tuple(brace_direction)))
+
+
+def _base_kernel(
+    sx: float, sy: float, sz: float, ex: float, ey: float, ez: float
+) -> Tuple[float, float, float, float, float, float, float]:
+    """部材の中心・長さ・単位方向ベクトルを計算（数値計算のみ）
+
+    Returns:
+        (cx, cy, cz, span, nx, ny, nz)。span が0の場合、方向は (0, 0, 0)
+    """
+    dx, dy, dz = ex - sx, ey - sy, ez - sz
+
+    # 中心 = 始点 + 差分の半分（差分を再利用）
+    cx, cy, cz = sx + dx * 0.5, sy + dy * 0.5, sz + dz * 0.5
+
+    # 座標軸に平行な部材（鉛直柱・直交梁）は平方根・除算を省略し、
+    # 厳密な単位方向ベクトルとする（参照方向キャッシュのキーも揃う）
+    if dx == 0.0 and dy == 0.0:
+        if dz != 0.0:
+            return cx, cy, cz, abs(dz), 0.0, 0.0, (1.0 if dz > 0.0 else -1.0)
+    elif dy == 0.0 and dz == 0.0:
+        return cx, cy, cz, abs(dx), (1.0 if dx > 0.0 else -1.0), 0.0, 0.0
+    elif dx == 0.0 and dz == 0.0:
+        return cx, cy, cz, abs(dy), 0.0, (1.0 if dy > 0.0 else -1.0), 0.0
+
+    span = math.hypot(dx, dy, dz)
+    if span > 0:
+        inv_span = 1.0 / span
+        return cx, cy, cz, span, dx * inv_span, dy * inv_span, dz * inv_span
+    return cx, cy, cz, span, 0.0, 0.0, 0.0
+
+
+def _normalize3(
+    x: float, y: float, z: float, fallback: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """3次元ベクトルを正規化（長さ1e-6以下の場合はfallbackを返す）"""
+    length = math.hypot(x, y, z)
+    if length > 1e-6:
+        # 逆数を1回だけ求め、各成分は乗算で正規化
+        inv = 1.0 / length
+        return (x * inv, y * inv, z * inv)
+    return fallback
+
+
+# 参照方向は方向ベクトルのみで決まる純粋関数のため、同一方向の部材
+# （直交する梁・鉛直柱など）で結果を再利用する
+
+
+@lru_cache(maxsize=4096)
+def _perp_horizontal(dx: float, dy: float) -> Tuple[float, float, float]:
+    """部材方向 (dx, dy, *) と鉛直方向の両方に直交する水平単位ベクトル
+
+    梁・柱・ブレース共通の計算（要素タイプ間でキャッシュを共有）。
+    水平成分がない場合はX軸を返す。
+    """
+    return _normalize3(-dy, dx, 0.0, (1.0, 0.0, 0.0))
+
+
+def _beam_reference_direction(
+    beam_direction: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """梁の参照方向を計算"""
+    # 梁が鉛直（Z軸方向）の場合
+    if abs(beam_direction[0]) < 1e-6 and abs(beam_direction[1]) < 1e-6:
+        return (1.0, 0.0, 0.0)
+
+    # 水平梁の場合、常にZ軸を断面のY軸とするための参照方向を計算
+    return _perp_horizontal(beam_direction[0], beam_direction[1])
+
+
+def _column_reference_direction(
+    column_direction: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """柱の参照方向を計算"""
+    # 鉛直柱（Z軸方向）の場合
+    if abs(column_direction[2]) > 0.9:  # ほぼ鉛直
+        return (1.0, 0.0, 0.0)
+
+    # 傾斜柱の場合、柱軸と重力方向に垂直な方向を求める
+    return _perp_horizontal(column_direction[0], column_direction[1])
+
+
+def _brace_reference_direction(
+    brace_direction: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """ブレースの参照方向を計算"""
+    # ブレースは一般的に斜め要素なので、重力方向（Z軸）に垂直な
+    # 最も近い水平方向を参照方向とする
+
+    # ブレースが完全に水平の場合
+    if abs(brace_direction[2]) < 1e-6:
+        # Y軸方向を参照とする
+        return (0.0, 1.0, 0.0)
+
+    # ブレースが完全に鉛直の場合
+    if abs(brace_direction[0]) < 1e-6 and abs(brace_direction[1]) < 1e-6:
+        return (1.0, 0.0, 0.0)
+
+    # 一般的な斜めブレースの場合、ブレース軸と鉛直方向に垂直な
+    # 水平方向を計算
+    return _perp_horizontal(brace_direction[0], brace_direction[1])
+
+
+# 要素タイプ毎の参照方向計算関数
+_REFERENCE_DIRECTION_FUNCTIONS = {
+    "BEAM": _beam_reference_direction,
+    "COLUMN": _column_reference_direction,
+    "BRACE": _brace_reference_direction,
+}
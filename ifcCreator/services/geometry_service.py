@@ -7,11 +7,10 @@ v2.2.0: 簡素化された統一実装 + Phase1強化（ジオメトリ配置精
 from typing import List, Optional, Dict, Any, Union
 import logging
 
-# v2.2.0: 統合アーキテクチャ - 簡素化されたジオメトリ構築
-from ..geometry.geometry_builder import GeometryBuilder
 from ..geometry.structural_geometry import (
     StructuralGeometryCalculator,
     StructuralElementGeometry,
+    StructuralPlacement,
 )
 from common.geometry import Point3D
 
@@ -33,7 +32,6 @@ class GeometryService:
         """
         self.file = ifc_file
         self.model_context = model_context
-        self.geometry_builder = GeometryBuilder()
 
     def create_linear_geometry(
         self, start_point: Point3D, end_point: Point3D, profile_start, profile_end=None
@@ -99,7 +97,7 @@ class GeometryService:
 
     def create_structural_placement(
         self, start_point: Point3D, end_point: Point3D, element_type: str = "BEAM"
-    ) -> Dict[str, Any]:
+    ) -> StructuralPlacement:
         """構造要素用の精密配置計算
 
         Phase 1強化: StructuralGeometryCalculatorを使用した精密配置
@@ -110,7 +108,7 @@ class GeometryService:
             element_type: 要素タイプ ("BEAM", "COLUMN", "BRACE")
 
         Returns:
-            精密配置情報
+            精密配置情報（origin, direction, ref_direction, length, element_type）
         """
         # StructuralGeometryCalculatorを使用して精密計算
         if element_type.upper() == "BEAM":
@@ -131,22 +129,10 @@ class GeometryService:
                 start_point, end_point
             )
 
-        return {
-            "origin": geometry.center,
-            "direction": geometry.direction,
-            "ref_direction": geometry.reference_direction,
-            "length": geometry.span,
-            "element_type": geometry.element_type,
-            "created_by": "GeometryService v2.2.0 Phase1-Enhanced",
-        }
-
-    def get_geometry_builder(self, element_type: str):
-        """要素タイプ別ジオメトリビルダーを取得
-
-        Args:
-            element_type: 要素タイプ
-
-        Returns:
-            適切なジオメトリビルダー
-        """
-        return self.geometry_builder
+        return StructuralPlacement(
+            origin=geometry.center,
+            direction=geometry.direction,
+            ref_direction=geometry.reference_direction,
+            length=geometry.span,
+            element_type=geometry.element_type,
+        )
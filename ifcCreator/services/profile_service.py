@@ -5,14 +5,33 @@
 重複を削除してシンプルなインターフェースを提供する責務分離アーキテクチャ
 """
 
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Tuple, Union
 import logging
+import operator
 from dataclasses import dataclass
 
+from common.ifc_file_cache import get_file_cache
+
 # v2.2.0: 統合アーキテクチャ - 簡素化されたプロファイル作成
 
 logger = logging.getLogger(__name__)
 
+# セクションから抽出する寸法属性と、その取得関数
+_DIMENSION_GETTERS = tuple(
+    (attr, operator.attrgetter(attr))
+    for attr in (
+        "width",
+        "height",
+        "thickness",
+        "radius",
+        "overall_depth",
+        "overall_width",
+        "web_thickness",
+        "flange_thickness",
+        "outer_diameter",
+    )
+)
+
 
 class ProfileService:
     """プロファイル作成の統一サービス
@@ -27,7 +46,14 @@ class ProfileService:
             ifc_file: IFCファイルオブジェクト（オプション）
         """
         self.file = ifc_file
-        self._cache: Dict[str, Any] = {}
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+
+        # 頻繁に使用するエンティティ生成メソッドを束縛（ファイル未指定時はNone）
+        if ifc_file:
+            self._mk_point = ifc_file.createIfcCartesianPoint
+            self._mk_placement2d = ifc_file.createIfcAxis2Placement2D
+        else:
+            self._mk_point = self._mk_placement2d = None
 
     def create_profile(self, section, element_type: str):
         """統一プロファイル作成インターフェース
@@ -39,33 +65,33 @@ class ProfileService:
         Returns:
             作成されたプロファイル（プレースホルダー）
         """
+        cache = self._cache
         cache_key = self._generate_cache_key(section, element_type)
-        if cache_key in self._cache:
-            logger.debug(f"Profile cache hit: {cache_key}")
-            return self._cache[cache_key]
+        profile = cache.get(cache_key)
+        if profile is not None:
+            logger.debug("Profile cache hit: %s", cache_key)
+            return profile
 
         # v2.2.0: 簡素化されたプロファイル作成
         profile = self._create_simple_profile(section, element_type)
 
-        self._cache[cache_key] = profile
-        logger.debug(f"Profile created and cached: {cache_key}")
+        cache[cache_key] = profile
+        logger.debug("Profile created and cached: %s", cache_key)
         return profile
 
-    def _generate_cache_key(self, section, element_type: str) -> str:
-        """キャッシュキーの生成"""
-        # セクションの主要属性からキーを生成
-        key_parts = [element_type]
-
-        if hasattr(section, "name"):
-            key_parts.append(f"name:{section.name}")
-        if hasattr(section, "width"):
-            key_parts.append(f"w:{section.width}")
-        if hasattr(section, "height"):
-            key_parts.append(f"h:{section.height}")
-        if hasattr(section, "section_type"):
-            key_parts.append(f"type:{section.section_type}")
+    def _generate_cache_key(self, section, element_type: str) -> Tuple[Any, ...]:
+        """キャッシュキーの生成
 
-        return "_".join(key_parts)
+        セクションの主要属性のタプル（文字列連結を行わない）。
+        属性を持たない場合はNoneとする。
+        """
+        return (
+            element_type,
+            getattr(section, "name", None),
+            getattr(section, "width", None),
+            getattr(section, "height", None),
+            getattr(section, "section_type", None),
+        )
 
     def _create_simple_profile(self, section, element_type: str):
         """実際のIFCプロファイル作成
@@ -84,42 +110,22 @@ class ProfileService:
         # 実際のIFCプロファイル作成（旧版ロジック統合）
         section_type = getattr(section, "section_type", "RECTANGLE")
 
-        if section_type == "RECTANGLE":
-            return self._create_rectangle_profile(section, element_type)
-        elif section_type == "CIRCLE":
-            return self._create_circle_profile(section, element_type)
-        elif section_type == "H":
-            return self._create_h_profile(section, element_type)
-        elif section_type == "BOX":
-            return self._create_box_profile(section, element_type)
-        elif section_type in ("C", "CHANNEL"):
-            return self._create_channel_profile(section, element_type)
-        elif section_type == "PIPE":
-            return self._create_pipe_profile(section, element_type)
-        elif section_type == "L":
-            return self._create_l_profile(section, element_type)
-        else:
-            logger.warning(f"Unsupported section type: {section_type}, using rectangle")
-            return self._create_rectangle_profile(section, element_type)
+        handler = self._PROFILE_DISPATCH.get(section_type)
+        if handler is None:
+            logger.warning(
+                "Unsupported section type: %s, using rectangle", section_type
+            )
+            handler = ProfileService._create_rectangle_profile
+        return handler(self, section, element_type)
 
     def _extract_dimensions(self, section) -> Dict[str, Any]:
         """セクションから寸法情報を抽出"""
         dimensions = {}
-        dimension_attrs = [
-            "width",
-            "height",
-            "thickness",
-            "radius",
-            "overall_depth",
-            "overall_width",
-            "web_thickness",
-            "flange_thickness",
-            "outer_diameter",
-        ]
-
-        for attr in dimension_attrs:
-            if hasattr(section, attr):
-                dimensions[attr] = getattr(section, attr)
+        for attr, getter in _DIMENSION_GETTERS:
+            try:
+                dimensions[attr] = getter(section)
+            except AttributeError:
+                pass
 
         return dimensions
 
@@ -152,19 +158,19 @@ class ProfileService:
 
         width, height = self._get_rectangle_dimensions(section)
 
-        if None in (width, height):
+        if width is None or height is None:
             raise ValueError(
                 "Width and height must be specified for rectangular section"
             )
 
         y_offset = self._calculate_y_offset(section, height, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = (
-            getattr(section, "stb_name", None) or f"RectProfile_{width}x{height}"
-        )
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = f"RectProfile_{width}x{height}"
         return self.file.createIfcRectangleProfileDef(
             ProfileType="AREA",
             ProfileName=profile_name,
@@ -183,11 +189,13 @@ class ProfileService:
             raise ValueError("Radius must be specified for circular section")
 
         y_offset = self._calculate_y_offset(section, radius * 2, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = getattr(section, "stb_name", None) or f"CircleProfile_R{radius}"
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = f"CircleProfile_R{radius}"
         return self.file.createIfcCircleProfileDef(
             ProfileType="AREA",
             ProfileName=profile_name,
@@ -197,28 +205,30 @@ class ProfileService:
 
     def _create_h_profile(self, section, element_type: str):
         """H形プロファイル作成（旧版ProfileFactoryBaseから移植）"""
-        required_attrs = [
-            getattr(section, "overall_depth", None),
-            getattr(section, "overall_width", None),
-            getattr(section, "web_thickness", None),
-            getattr(section, "flange_thickness", None),
-        ]
-        if None in required_attrs:
+        # 必要な属性は1回ずつ取得してローカル変数で扱う
+        overall_depth = getattr(section, "overall_depth", None)
+        overall_width = getattr(section, "overall_width", None)
+        web_thickness = getattr(section, "web_thickness", None)
+        flange_thickness = getattr(section, "flange_thickness", None)
+        if (
+            overall_depth is None
+            or overall_width is None
+            or web_thickness is None
+            or flange_thickness is None
+        ):
             raise ValueError("H-shape parameters must be specified")
 
-        overall_depth = section.overall_depth
-        overall_width = section.overall_width
-        web_thickness = section.web_thickness
-        flange_thickness = section.flange_thickness
-
         y_offset = self._calculate_y_offset(section, overall_depth, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = getattr(section, "stb_name", None) or (
-            f"HProfile_{overall_depth}x{overall_width}x{web_thickness}x{flange_thickness}"
-        )
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = (
+                f"HProfile_{overall_depth}x{overall_width}x"
+                f"{web_thickness}x{flange_thickness}"
+            )
 
         return self.file.createIfcIShapeProfileDef(
             ProfileType="AREA",
@@ -242,18 +252,17 @@ class ProfileService:
             section, "thickness", None
         )
 
-        if None in (width, height, thickness):
+        if width is None or height is None or thickness is None:
             raise ValueError("BOX section parameters must be specified")
 
         y_offset = self._calculate_y_offset(section, height, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = (
-            getattr(section, "stb_name", None)
-            or f"BoxProfile_{width}x{height}x{thickness}"
-        )
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = f"BoxProfile_{width}x{height}x{thickness}"
 
         return self.file.createIfcRectangleHollowProfileDef(
             ProfileType="AREA",
@@ -279,18 +288,17 @@ class ProfileService:
         )
         flange_thickness = getattr(section, "flange_thickness", None) or web_thickness
 
-        if None in (overall_depth, flange_width, web_thickness):
+        if overall_depth is None or flange_width is None or web_thickness is None:
             raise ValueError("Channel section parameters must be specified")
 
         y_offset = self._calculate_y_offset(section, overall_depth, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = (
-            getattr(section, "stb_name", None)
-            or f"ChannelProfile_{overall_depth}x{flange_width}"
-        )
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = f"ChannelProfile_{overall_depth}x{flange_width}"
 
         return self.file.createIfcCShapeProfileDef(
             ProfileType="AREA",
@@ -309,19 +317,18 @@ class ProfileService:
             section, "thickness", None
         )
 
-        if None in (outer_diameter, thickness):
+        if outer_diameter is None or thickness is None:
             raise ValueError("Pipe section parameters must be specified")
 
         radius = outer_diameter / 2
         y_offset = self._calculate_y_offset(section, outer_diameter, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = (
-            getattr(section, "stb_name", None)
-            or f"PipeProfile_D{outer_diameter}x{thickness}"
-        )
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = f"PipeProfile_D{outer_diameter}x{thickness}"
 
         return self.file.createIfcCircleHollowProfileDef(
             ProfileType="AREA",
@@ -338,18 +345,17 @@ class ProfileService:
         height = getattr(section, "height", None)
         thickness = getattr(section, "thickness", None)
 
-        if None in (width, height, thickness):
+        if width is None or height is None or thickness is None:
             raise ValueError("L section parameters must be specified")
 
         y_offset = self._calculate_y_offset(section, height, element_type)
-        pos2d = self.file.createIfcAxis2Placement2D(
-            Location=self.file.createIfcCartesianPoint([0.0, y_offset])
-        )
+        pos2d = self._get_placement2d(y_offset)
 
-        profile_name = (
-            getattr(section, "stb_name", None)
-            or f"LProfile_{width}x{height}x{thickness}"
-        )
+        stb_name = getattr(section, "stb_name", None)
+        if stb_name:
+            profile_name = stb_name
+        else:
+            profile_name = f"LProfile_{width}x{height}x{thickness}"
 
         return self.file.createIfcLShapeProfileDef(
             ProfileType="AREA",
@@ -360,6 +366,26 @@ class ProfileService:
             Thickness=thickness,
         )
 
+    def _get_placement2d(self, y_offset: float):
+        """Y方向オフセットのみを持つIfcAxis2Placement2Dを再利用して取得
+
+        Args:
+            y_offset: プロファイル原点のY方向オフセット
+
+        Returns:
+            IfcAxis2Placement2D
+        """
+        # ProfileServiceは呼び出し毎に生成されることがあるため、ファイル単位で保持
+        cache = get_file_cache(self.file, "IfcAxis2Placement2D")
+
+        key = round(y_offset, 9)
+        placement = cache.get(key)
+        if placement is None:
+            placement = cache[key] = self._mk_placement2d(
+                Location=self._mk_point([0.0, y_offset])
+            )
+        return placement
+
     def _get_rectangle_dimensions(self, section):
         """矩形寸法取得（梁・柱対応）"""
         # 梁用
@@ -381,3 +407,15 @@ class ProfileService:
             return -height / 2  # 上端中心配置
         else:
             return 0.0  # 中心配置
+
+    # セクションタイプ別のプロファイル作成メソッド（別名も登録）
+    _PROFILE_DISPATCH = {
+        "RECTANGLE": _create_rectangle_profile,
+        "CIRCLE": _create_circle_profile,
+        "H": _create_h_profile,
+        "BOX": _create_box_profile,
+        "C": _create_channel_profile,
+        "CHANNEL": _create_channel_profile,
+        "PIPE": _create_pipe_profile,
+        "L": _create_l_profile,
+    }
@@ -4,14 +4,112 @@
 v2.2.0: 簡素化された統一実装
 """
 
-from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Dict, Any, Union
 import logging
-from common.guid_utils import create_ifc_guid
+import math
+from common.guid_utils import create_ifc_guids
+from common.ifc_file_cache import get_file_cache
 
 # v2.2.0: 統合アーキテクチャ - 簡素化されたプロパティ管理
 
 logger = logging.getLogger(__name__)
 
+# 断面寸法プロパティセットの関連付けを共有するファイルキャッシュ名
+# {(プロパティセット名, 値タプル): (IfcPropertySet, IfcRelDefinesByProperties, 関連要素リスト)}
+# 関連要素はPython側のリストに蓄積し、flush_shared_property_sets で一括設定する
+_PSET_RELATIONS_CACHE = "IfcRelDefinesByProperties"
+
+# プロパティセット作成の元になる定義キー
+_PROPERTY_SOURCE_KEYS = frozenset(("tag", "start_point", "end_point", "section"))
+
+# 座標プロパティ名（始点XYZ・終点XYZの順、値と対応させて使用）
+_LINE_COORDINATE_NAMES = (
+    "StartPointX",
+    "StartPointY",
+    "StartPointZ",
+    "EndPointX",
+    "EndPointY",
+    "EndPointZ",
+)
+_COLUMN_COORDINATE_NAMES = (
+    "BottomPointX",
+    "BottomPointY",
+    "BottomPointZ",
+    "TopPointX",
+    "TopPointY",
+    "TopPointZ",
+    "Height",
+)
+_BRACE_COORDINATE_NAMES = _LINE_COORDINATE_NAMES + ("Length",)
+
+# 断面寸法プロパティ（(断面属性名, プロパティ名)、値が未設定・0の属性は省略）
+_BEAM_SECTION_ATTRIBUTES = (
+    ("width", "Width"),
+    ("height", "Height"),
+    ("thickness", "Thickness"),
+)
+_COLUMN_SECTION_ATTRIBUTES = (
+    ("width", "Width"),
+    ("height", "Height"),
+    ("thickness", "WallThickness"),
+)
+_BRACE_SECTION_ATTRIBUTES = (
+    ("overall_depth", "OverallDepth"),
+    ("flange_width", "FlangeWidth"),
+    ("web_thickness", "WebThickness"),
+    ("flange_thickness", "FlangeThickness"),
+    ("width", "Width"),
+    ("height", "Height"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _material_properties(material_name: str, strength_class: str) -> Mapping[str, Any]:
+    """材料名・強度クラス毎の材料プロパティを作成（読み取り専用で共有）"""
+    return MappingProxyType(
+        {
+            "material_name": material_name,
+            "strength_class": strength_class,
+            "created_by": "PropertyService v2.2.0",
+        }
+    )
+
+
+def _collect_section_entries(section, attributes) -> tuple:
+    """断面から値が設定された寸法を (プロパティ名, 値) のタプルとして取得
+
+    Args:
+        section: 断面オブジェクト
+        attributes: ((断面属性名, プロパティ名), ...)
+
+    Returns:
+        ((プロパティ名, 値), ...)
+    """
+    entries = []
+    for attr, name in attributes:
+        value = getattr(section, attr, None)
+        if value:
+            entries.append((name, value))
+    return tuple(entries)
+
+
+def flush_shared_property_sets(ifc_file) -> None:
+    """共有プロパティセットに蓄積した関連要素をRelatedObjectsへ書き込む
+
+    要素毎にRelatedObjectsを再設定すると共有要素数の2乗のコストになるため、
+    ファイル出力前に本関数で1回だけ設定する。
+
+    Args:
+        ifc_file: IFCファイル
+    """
+    relations = get_file_cache(ifc_file, _PSET_RELATIONS_CACHE)
+    for _, rel, related_objects in relations.values():
+        # 作成時の1要素のみの関連付けは設定済み
+        if len(related_objects) > 1:
+            rel.RelatedObjects = related_objects
+
 
 class PropertyService:
     """プロパティ管理の統一サービス
@@ -27,6 +125,22 @@ class PropertyService:
         """
         self.file = ifc_file
 
+    def _get_common_values(self) -> tuple:
+        """Pset_*Commonで共通の不変値を現在のIFCファイル毎に再利用して取得
+
+        Returns:
+            (IfcBoolean(False), IfcBoolean(True), IfcLabel(""))
+        """
+        cache = get_file_cache(self.file, "PropertyCommonValues")
+        values = cache.get(None)
+        if values is None:
+            values = cache[None] = (
+                self.file.createIfcBoolean(False),
+                self.file.createIfcBoolean(True),
+                self.file.createIfcLabel(""),
+            )
+        return values
+
     def create_element_properties(
         self,
         element_type: str,
@@ -47,13 +161,13 @@ class PropertyService:
         """
         # v2.2.0: 簡素化されたプロパティ作成
         try:
-            logger.debug(f"Creating properties for {element_type}")
+            logger.debug("Creating properties for %s", element_type)
             return self._create_simple_properties(
                 element_type, definition, element_instance
             )
 
         except Exception as e:
-            logger.error(f"Failed to create properties for {element_type}: {e}")
+            logger.error("Failed to create properties for %s: %s", element_type, e)
             return []
 
     def _create_simple_properties(
@@ -69,66 +183,141 @@ class PropertyService:
 
         properties = []
 
+        # タグ・座標・断面のいずれも持たない定義ではプロパティセットを作成しない
+        if definition.keys().isdisjoint(_PROPERTY_SOURCE_KEYS):
+            logger.debug("No property sources in %s definition", element_type)
+            return properties
+
         try:
-            if element_type.lower() == "beam":
-                properties.extend(
-                    self._create_beam_properties(definition, element_instance)
-                )
-            elif element_type.lower() == "column":
-                properties.extend(
-                    self._create_column_properties(definition, element_instance)
-                )
-            elif element_type.lower() == "slab":
-                properties.extend(
-                    self._create_slab_properties(definition, element_instance)
-                )
-            elif element_type.lower() == "wall":
-                properties.extend(
-                    self._create_wall_properties(definition, element_instance)
-                )
-            elif element_type.lower() == "brace":
-                properties.extend(
-                    self._create_brace_properties(definition, element_instance)
-                )
+            handler = self._PROPERTY_DISPATCH.get(element_type.lower())
+            if handler is not None:
+                properties.extend(handler(self, definition, element_instance))
 
         except Exception as e:
-            logger.error(f"要素プロパティの設定に失敗しました。詳細: {e}")
+            logger.error("要素プロパティの設定に失敗しました。詳細: %s", e)
 
         return properties
 
+    def _create_common_props(self, definition: Dict[str, Any]) -> List:
+        """Pset_*Common用のプロパティを作成
+
+        タグが定義されていない場合はReferenceを省略する。
+
+        Args:
+            definition: 要素定義辞書
+
+        Returns:
+            IfcPropertySingleValueのリスト
+        """
+        mk_value = self.file.createIfcPropertySingleValue
+        mk_label = self.file.createIfcLabel
+        is_external, load_bearing, fire_rating = self._get_common_values()
+        props = []
+        tag = definition.get("tag")
+        if tag is not None:
+            props.append(mk_value("Reference", None, mk_label(tag), None))
+        props.append(mk_value("IsExternal", None, is_external, None))
+        props.append(mk_value("LoadBearing", None, load_bearing, None))
+        props.append(mk_value("FireRating", None, fire_rating, None))
+        return props
+
+    def _make_length_props(self, pairs) -> List:
+        """長さプロパティ（IfcLengthMeasure）を一括作成
+
+        Args:
+            pairs: (プロパティ名, 値) の反復可能オブジェクト
+
+        Returns:
+            IfcPropertySingleValueのリスト
+        """
+        mk_value = self.file.createIfcPropertySingleValue
+        mk_length = self.file.createIfcLengthMeasure
+
+        # 通り芯・階高に揃った同一座標値のIfcLengthMeasureを再利用
+        measures = get_file_cache(self.file, "IfcLengthMeasure")
+
+        props = []
+        for name, value in pairs:
+            key = round(value, 9)
+            measure = measures.get(key)
+            if measure is None:
+                measure = measures[key] = mk_length(value)
+            props.append(mk_value(name, None, measure, None))
+        return props
+
+    def _relate_shared_property_set(
+        self, name: str, entries: tuple, element_instance
+    ) -> List:
+        """値のみで決まるプロパティセットを同一IFCファイル内で共有して関連付け
+
+        同一内容のプロパティセットは1つのIfcPropertySetと1つの
+        IfcRelDefinesByPropertiesにまとめる。2つ目以降の要素は関連要素リストに
+        追加し、RelatedObjectsへは flush_shared_property_sets で反映する。
+
+        Args:
+            name: プロパティセット名
+            entries: ((プロパティ名, 値), ...)。文字列はIfcLabel、数値はIfcLengthMeasure
+            element_instance: IFC要素インスタンス
+
+        Returns:
+            [プロパティセット, 関連付け]
+        """
+        relations = get_file_cache(self.file, _PSET_RELATIONS_CACHE)
+
+        key = (name, entries)
+        shared = relations.get(key)
+        if shared is not None:
+            pset, rel, related_objects = shared
+            related_objects.append(element_instance)
+            return [pset, rel]
+
+        mk_value = self.file.createIfcPropertySingleValue
+        mk_label = self.file.createIfcLabel
+        mk_length = self.file.createIfcLengthMeasure
+        pset_id, rel_id = create_ifc_guids(2)
+        props = [
+            mk_value(
+                prop_name,
+                None,
+                mk_label(value) if isinstance(value, str) else mk_length(value),
+                None,
+            )
+            for prop_name, value in entries
+        ]
+        pset = self.file.createIfcPropertySet(
+            GlobalId=pset_id,
+            Name=name,
+            HasProperties=props,
+        )
+        rel = self.file.createIfcRelDefinesByProperties(
+            GlobalId=rel_id,
+            RelatedObjects=[element_instance],
+            RelatingPropertyDefinition=pset,
+        )
+        relations[key] = (pset, rel, [element_instance])
+        return [pset, rel]
+
     def _create_beam_properties(
         self, definition: Dict[str, Any], element_instance
     ) -> List:
         """梁用プロパティセット作成"""
+        mk_pset = self.file.createIfcPropertySet
+        mk_rel = self.file.createIfcRelDefinesByProperties
         properties = []
+        has_coordinates = "start_point" in definition and "end_point" in definition
+        global_ids = iter(create_ifc_guids(4 if has_coordinates else 2))
 
         # Pset_BeamCommon
-        beam_common_props = [
-            self.file.createIfcPropertySingleValue(
-                "Reference",
-                None,
-                self.file.createIfcLabel(definition.get("tag", "")),
-                None,
-            ),
-            self.file.createIfcPropertySingleValue(
-                "IsExternal", None, self.file.createIfcBoolean(False), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "LoadBearing", None, self.file.createIfcBoolean(True), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "FireRating", None, self.file.createIfcLabel(""), None
-            ),
-        ]
+        beam_common_props = self._create_common_props(definition)
 
-        pset_beam_common = self.file.createIfcPropertySet(
-            GlobalId=create_ifc_guid(),
+        pset_beam_common = mk_pset(
+            GlobalId=next(global_ids),
             Name="Pset_BeamCommon",
             HasProperties=beam_common_props,
         )
 
-        rel_beam_common = self.file.createIfcRelDefinesByProperties(
-            GlobalId=create_ifc_guid(),
+        rel_beam_common = mk_rel(
+            GlobalId=next(global_ids),
             RelatedObjects=[element_instance],
             RelatingPropertyDefinition=pset_beam_common,
         )
@@ -136,57 +325,32 @@ class PropertyService:
         properties.extend([pset_beam_common, rel_beam_common])
 
         # Pset_BeamReferenceLineCoordinates (座標プロパティ)
-        if "start_point" in definition and "end_point" in definition:
+        if has_coordinates:
             start_point = definition["start_point"]
             end_point = definition["end_point"]
 
-            coord_props = [
-                self.file.createIfcPropertySingleValue(
-                    "StartPointX",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.x),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "StartPointY",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.y),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "StartPointZ",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.z),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "EndPointX",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.x),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "EndPointY",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.y),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "EndPointZ",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.z),
-                    None,
-                ),
-            ]
-
-            pset_coord = self.file.createIfcPropertySet(
-                GlobalId=create_ifc_guid(),
+            coord_props = self._make_length_props(
+                zip(
+                    _LINE_COORDINATE_NAMES,
+                    (
+                        start_point.x,
+                        start_point.y,
+                        start_point.z,
+                        end_point.x,
+                        end_point.y,
+                        end_point.z,
+                    ),
+                )
+            )
+
+            pset_coord = mk_pset(
+                GlobalId=next(global_ids),
                 Name="Pset_BeamReferenceLineCoordinates",
                 HasProperties=coord_props,
             )
 
-            rel_coord = self.file.createIfcRelDefinesByProperties(
-                GlobalId=create_ifc_guid(),
+            rel_coord = mk_rel(
+                GlobalId=next(global_ids),
                 RelatedObjects=[element_instance],
                 RelatingPropertyDefinition=pset_coord,
             )
@@ -196,86 +360,40 @@ class PropertyService:
         # Pset_SectionDimensions (断面寸法プロパティ)
         if "section" in definition:
             section = definition["section"]
-            section_props = []
-
-            if hasattr(section, "width") and section.width:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Width",
-                        None,
-                        self.file.createIfcLengthMeasure(section.width),
-                        None,
-                    )
-                )
-            if hasattr(section, "height") and section.height:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Height",
-                        None,
-                        self.file.createIfcLengthMeasure(section.height),
-                        None,
-                    )
-                )
-            if hasattr(section, "thickness") and section.thickness:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Thickness",
-                        None,
-                        self.file.createIfcLengthMeasure(section.thickness),
-                        None,
-                    )
-                )
-
-            if section_props:
-                pset_section = self.file.createIfcPropertySet(
-                    GlobalId=create_ifc_guid(),
-                    Name="Pset_SectionDimensions",
-                    HasProperties=section_props,
-                )
+            section_entries = _collect_section_entries(
+                section, _BEAM_SECTION_ATTRIBUTES
+            )
 
-                rel_section = self.file.createIfcRelDefinesByProperties(
-                    GlobalId=create_ifc_guid(),
-                    RelatedObjects=[element_instance],
-                    RelatingPropertyDefinition=pset_section,
+            if section_entries:
+                properties.extend(
+                    self._relate_shared_property_set(
+                        "Pset_SectionDimensions", section_entries, element_instance
+                    )
                 )
 
-                properties.extend([pset_section, rel_section])
-
         return properties
 
     def _create_column_properties(
         self, definition: Dict[str, Any], element_instance
     ) -> List:
         """柱用プロパティセット作成"""
+        mk_pset = self.file.createIfcPropertySet
+        mk_rel = self.file.createIfcRelDefinesByProperties
         properties = []
+        has_coordinates = "start_point" in definition and "end_point" in definition
+        global_ids = iter(create_ifc_guids(4 if has_coordinates else 2))
 
         # Pset_ColumnCommon
-        column_common_props = [
-            self.file.createIfcPropertySingleValue(
-                "Reference",
-                None,
-                self.file.createIfcLabel(definition.get("tag", "")),
-                None,
-            ),
-            self.file.createIfcPropertySingleValue(
-                "IsExternal", None, self.file.createIfcBoolean(False), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "LoadBearing", None, self.file.createIfcBoolean(True), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "FireRating", None, self.file.createIfcLabel(""), None
-            ),
-        ]
+        column_common_props = self._create_common_props(definition)
 
-        pset_column_common = self.file.createIfcPropertySet(
-            GlobalId=create_ifc_guid(),
+        pset_column_common = mk_pset(
+            GlobalId=next(global_ids),
             Name="Pset_ColumnCommon",
             HasProperties=column_common_props,
         )
 
-        rel_column_common = self.file.createIfcRelDefinesByProperties(
-            GlobalId=create_ifc_guid(),
+        rel_column_common = mk_rel(
+            GlobalId=next(global_ids),
             RelatedObjects=[element_instance],
             RelatingPropertyDefinition=pset_column_common,
         )
@@ -283,61 +401,34 @@ class PropertyService:
         properties.extend([pset_column_common, rel_column_common])
 
         # Pset_ColumnCoordinates
-        if "start_point" in definition and "end_point" in definition:
+        if has_coordinates:
             start_point = definition["start_point"]
             end_point = definition["end_point"]
             height = abs(end_point.z - start_point.z)
 
-            coord_props = [
-                self.file.createIfcPropertySingleValue(
-                    "BottomPointX",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.x),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "BottomPointY",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.y),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "BottomPointZ",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.z),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "TopPointX",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.x),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "TopPointY",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.y),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "TopPointZ",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.z),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "Height", None, self.file.createIfcLengthMeasure(height), None
-                ),
-            ]
-
-            pset_coord = self.file.createIfcPropertySet(
-                GlobalId=create_ifc_guid(),
+            coord_props = self._make_length_props(
+                zip(
+                    _COLUMN_COORDINATE_NAMES,
+                    (
+                        start_point.x,
+                        start_point.y,
+                        start_point.z,
+                        end_point.x,
+                        end_point.y,
+                        end_point.z,
+                        height,
+                    ),
+                )
+            )
+
+            pset_coord = mk_pset(
+                GlobalId=next(global_ids),
                 Name="Pset_ColumnCoordinates",
                 HasProperties=coord_props,
             )
 
-            rel_coord = self.file.createIfcRelDefinesByProperties(
-                GlobalId=create_ifc_guid(),
+            rel_coord = mk_rel(
+                GlobalId=next(global_ids),
                 RelatedObjects=[element_instance],
                 RelatingPropertyDefinition=pset_coord,
             )
@@ -347,86 +438,41 @@ class PropertyService:
         # Pset_ColumnSectionDimensions
         if "section" in definition:
             section = definition["section"]
-            section_props = []
-
-            if hasattr(section, "width") and section.width:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Width",
-                        None,
-                        self.file.createIfcLengthMeasure(section.width),
-                        None,
-                    )
-                )
-            if hasattr(section, "height") and section.height:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Height",
-                        None,
-                        self.file.createIfcLengthMeasure(section.height),
-                        None,
-                    )
-                )
-            if hasattr(section, "thickness") and section.thickness:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "WallThickness",
-                        None,
-                        self.file.createIfcLengthMeasure(section.thickness),
-                        None,
-                    )
-                )
-
-            if section_props:
-                pset_section = self.file.createIfcPropertySet(
-                    GlobalId=create_ifc_guid(),
-                    Name="Pset_ColumnSectionDimensions",
-                    HasProperties=section_props,
-                )
+            section_entries = _collect_section_entries(
+                section, _COLUMN_SECTION_ATTRIBUTES
+            )
 
-                rel_section = self.file.createIfcRelDefinesByProperties(
-                    GlobalId=create_ifc_guid(),
-                    RelatedObjects=[element_instance],
-                    RelatingPropertyDefinition=pset_section,
+            if section_entries:
+                properties.extend(
+                    self._relate_shared_property_set(
+                        "Pset_ColumnSectionDimensions",
+                        section_entries,
+                        element_instance,
+                    )
                 )
 
-                properties.extend([pset_section, rel_section])
-
         return properties
 
     def _create_slab_properties(
         self, definition: Dict[str, Any], element_instance
     ) -> List:
         """スラブ用プロパティセット作成"""
+        mk_pset = self.file.createIfcPropertySet
+        mk_rel = self.file.createIfcRelDefinesByProperties
         properties = []
+        global_ids = iter(create_ifc_guids(2))
 
         # Pset_SlabCommon
-        slab_common_props = [
-            self.file.createIfcPropertySingleValue(
-                "Reference",
-                None,
-                self.file.createIfcLabel(definition.get("tag", "")),
-                None,
-            ),
-            self.file.createIfcPropertySingleValue(
-                "IsExternal", None, self.file.createIfcBoolean(False), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "LoadBearing", None, self.file.createIfcBoolean(True), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "FireRating", None, self.file.createIfcLabel(""), None
-            ),
-        ]
+        slab_common_props = self._create_common_props(definition)
 
-        pset_slab_common = self.file.createIfcPropertySet(
-            GlobalId=create_ifc_guid(),
+        pset_slab_common = mk_pset(
+            GlobalId=next(global_ids),
             Name="Pset_SlabCommon",
             HasProperties=slab_common_props,
         )
 
-        rel_slab_common = self.file.createIfcRelDefinesByProperties(
-            GlobalId=create_ifc_guid(),
+        rel_slab_common = mk_rel(
+            GlobalId=next(global_ids),
             RelatedObjects=[element_instance],
             RelatingPropertyDefinition=pset_slab_common,
         )
@@ -439,35 +485,22 @@ class PropertyService:
         self, definition: Dict[str, Any], element_instance
     ) -> List:
         """壁用プロパティセット作成"""
+        mk_pset = self.file.createIfcPropertySet
+        mk_rel = self.file.createIfcRelDefinesByProperties
         properties = []
+        global_ids = iter(create_ifc_guids(2))
 
         # Pset_WallCommon
-        wall_common_props = [
-            self.file.createIfcPropertySingleValue(
-                "Reference",
-                None,
-                self.file.createIfcLabel(definition.get("tag", "")),
-                None,
-            ),
-            self.file.createIfcPropertySingleValue(
-                "IsExternal", None, self.file.createIfcBoolean(False), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "LoadBearing", None, self.file.createIfcBoolean(True), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "FireRating", None, self.file.createIfcLabel(""), None
-            ),
-        ]
+        wall_common_props = self._create_common_props(definition)
 
-        pset_wall_common = self.file.createIfcPropertySet(
-            GlobalId=create_ifc_guid(),
+        pset_wall_common = mk_pset(
+            GlobalId=next(global_ids),
             Name="Pset_WallCommon",
             HasProperties=wall_common_props,
         )
 
-        rel_wall_common = self.file.createIfcRelDefinesByProperties(
-            GlobalId=create_ifc_guid(),
+        rel_wall_common = mk_rel(
+            GlobalId=next(global_ids),
             RelatedObjects=[element_instance],
             RelatingPropertyDefinition=pset_wall_common,
         )
@@ -483,35 +516,23 @@ class PropertyService:
         
         Phase2強化: ブレース専用プロパティセット
         """
+        mk_pset = self.file.createIfcPropertySet
+        mk_rel = self.file.createIfcRelDefinesByProperties
         properties = []
+        has_coordinates = "start_point" in definition and "end_point" in definition
+        global_ids = iter(create_ifc_guids(4 if has_coordinates else 2))
 
         # Pset_MemberCommon (ブレースはIfcMemberとして作成されるため)
-        brace_common_props = [
-            self.file.createIfcPropertySingleValue(
-                "Reference",
-                None,
-                self.file.createIfcLabel(definition.get("tag", "")),
-                None,
-            ),
-            self.file.createIfcPropertySingleValue(
-                "IsExternal", None, self.file.createIfcBoolean(False), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "LoadBearing", None, self.file.createIfcBoolean(True), None
-            ),
-            self.file.createIfcPropertySingleValue(
-                "FireRating", None, self.file.createIfcLabel(""), None
-            ),
-        ]
+        brace_common_props = self._create_common_props(definition)
 
-        pset_brace_common = self.file.createIfcPropertySet(
-            GlobalId=create_ifc_guid(),
+        pset_brace_common = mk_pset(
+            GlobalId=next(global_ids),
             Name="Pset_MemberCommon",
             HasProperties=brace_common_props,
         )
 
-        rel_brace_common = self.file.createIfcRelDefinesByProperties(
-            GlobalId=create_ifc_guid(),
+        rel_brace_common = mk_rel(
+            GlobalId=next(global_ids),
             RelatedObjects=[element_instance],
             RelatingPropertyDefinition=pset_brace_common,
         )
@@ -519,73 +540,40 @@ class PropertyService:
         properties.extend([pset_brace_common, rel_brace_common])
 
         # Pset_BraceCoordinates (ブレース専用座標プロパティ)
-        if "start_point" in definition and "end_point" in definition:
+        if has_coordinates:
             start_point = definition["start_point"]
             end_point = definition["end_point"]
 
-            coord_props = [
-                self.file.createIfcPropertySingleValue(
-                    "StartPointX",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.x),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "StartPointY",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.y),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "StartPointZ",
-                    None,
-                    self.file.createIfcLengthMeasure(start_point.z),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "EndPointX",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.x),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "EndPointY",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.y),
-                    None,
-                ),
-                self.file.createIfcPropertySingleValue(
-                    "EndPointZ",
-                    None,
-                    self.file.createIfcLengthMeasure(end_point.z),
-                    None,
-                ),
-            ]
-
             # ブレース長さを計算
-            import math
-            length = math.sqrt(
-                (end_point.x - start_point.x) ** 2
-                + (end_point.y - start_point.y) ** 2
-                + (end_point.z - start_point.z) ** 2
+            length = math.hypot(
+                end_point.x - start_point.x,
+                end_point.y - start_point.y,
+                end_point.z - start_point.z,
             )
-            coord_props.append(
-                self.file.createIfcPropertySingleValue(
-                    "Length",
-                    None,
-                    self.file.createIfcLengthMeasure(length),
-                    None,
+
+            coord_props = self._make_length_props(
+                zip(
+                    _BRACE_COORDINATE_NAMES,
+                    (
+                        start_point.x,
+                        start_point.y,
+                        start_point.z,
+                        end_point.x,
+                        end_point.y,
+                        end_point.z,
+                        length,
+                    ),
                 )
             )
 
-            pset_coord = self.file.createIfcPropertySet(
-                GlobalId=create_ifc_guid(),
+            pset_coord = mk_pset(
+                GlobalId=next(global_ids),
                 Name="Pset_BraceCoordinates",
                 HasProperties=coord_props,
             )
 
-            rel_coord = self.file.createIfcRelDefinesByProperties(
-                GlobalId=create_ifc_guid(),
+            rel_coord = mk_rel(
+                GlobalId=next(global_ids),
                 RelatedObjects=[element_instance],
                 RelatingPropertyDefinition=pset_coord,
             )
@@ -595,97 +583,37 @@ class PropertyService:
         # Pset_BraceSectionDimensions (ブレース断面寸法プロパティ)
         if "section" in definition:
             section = definition["section"]
-            section_props = []
-
-            # ブレース特有の断面情報
-            if hasattr(section, "section_type"):
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "SectionType",
-                        None,
-                        self.file.createIfcLabel(section.section_type),
-                        None,
-                    )
-                )
-
-            # L形断面の場合
-            if hasattr(section, "overall_depth") and section.overall_depth:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "OverallDepth",
-                        None,
-                        self.file.createIfcLengthMeasure(section.overall_depth),
-                        None,
-                    )
-                )
-            if hasattr(section, "flange_width") and section.flange_width:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "FlangeWidth",
-                        None,
-                        self.file.createIfcLengthMeasure(section.flange_width),
-                        None,
-                    )
-                )
-            if hasattr(section, "web_thickness") and section.web_thickness:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "WebThickness",
-                        None,
-                        self.file.createIfcLengthMeasure(section.web_thickness),
-                        None,
-                    )
-                )
-            if hasattr(section, "flange_thickness") and section.flange_thickness:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "FlangeThickness",
-                        None,
-                        self.file.createIfcLengthMeasure(section.flange_thickness),
-                        None,
-                    )
-                )
+            # ブレース特有の断面情報（L形断面の寸法・汎用寸法を含む）
+            section_type = getattr(section, "section_type", None)
+            section_entries = _collect_section_entries(
+                section, _BRACE_SECTION_ATTRIBUTES
+            )
+            if section_type is not None:
+                section_entries = (("SectionType", section_type),) + section_entries
 
-            # 汎用寸法プロパティ
-            if hasattr(section, "width") and section.width:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Width",
-                        None,
-                        self.file.createIfcLengthMeasure(section.width),
-                        None,
-                    )
-                )
-            if hasattr(section, "height") and section.height:
-                section_props.append(
-                    self.file.createIfcPropertySingleValue(
-                        "Height",
-                        None,
-                        self.file.createIfcLengthMeasure(section.height),
-                        None,
+            if section_entries:
+                properties.extend(
+                    self._relate_shared_property_set(
+                        "Pset_BraceSectionDimensions",
+                        section_entries,
+                        element_instance,
                     )
                 )
 
-            if section_props:
-                pset_section = self.file.createIfcPropertySet(
-                    GlobalId=create_ifc_guid(),
-                    Name="Pset_BraceSectionDimensions",
-                    HasProperties=section_props,
-                )
-
-                rel_section = self.file.createIfcRelDefinesByProperties(
-                    GlobalId=create_ifc_guid(),
-                    RelatedObjects=[element_instance],
-                    RelatingPropertyDefinition=pset_section,
-                )
-
-                properties.extend([pset_section, rel_section])
-
         return properties
 
+    # 要素タイプ別のプロパティセット作成メソッド
+    _PROPERTY_DISPATCH = {
+        "beam": _create_beam_properties,
+        "column": _create_column_properties,
+        "slab": _create_slab_properties,
+        "wall": _create_wall_properties,
+        "brace": _create_brace_properties,
+    }
+
     def create_material_properties(
         self, material_name: str, strength_class: str = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """材料プロパティを作成
 
         Args:
@@ -693,30 +621,9 @@ class PropertyService:
             strength_class: 強度クラス
 
         Returns:
-            材料プロパティ辞書
+            材料プロパティ（共有されるため読み取り専用）
         """
-        return {
-            "material_name": material_name,
-            "strength_class": strength_class or "Default",
-            "created_by": "PropertyService v2.2.0",
-        }
-
-    def create_structural_properties(
-        self, section_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """構造プロパティを作成
-
-        Args:
-            section_data: 断面データ
-
-        Returns:
-            構造プロパティ辞書
-        """
-        return {
-            "section_type": section_data.get("section_type", "Unknown"),
-            "dimensions": section_data.get("dimensions", {}),
-            "created_by": "PropertyService v2.2.0",
-        }
+        return _material_properties(material_name, strength_class or "Default")
 
     def get_property_manager(self, element_type: str):
         """要素タイプ別プロパティマネージャーを取得
@@ -728,7 +635,9 @@ class PropertyService:
 
     # === 旧版PropertyManagerBaseから移植したメソッド ===
 
-    def create_structural_properties(self, property_data: Dict[str, tuple]) -> list:
+    def create_structural_properties_from_spec(
+        self, property_data: Dict[str, tuple]
+    ) -> list:
         """構造要素の共通プロパティを一括作成
 
         Args:
@@ -764,7 +673,7 @@ class PropertyService:
                         self._create_identifier_property(prop_name, str(value))
                     )
             except (ValueError, TypeError) as e:
-                logger.warning(f"プロパティ '{prop_name}' の作成に失敗: {e}")
+                logger.warning("プロパティ '%s' の作成に失敗: %s", prop_name, e)
                 continue
 
         return properties
@@ -799,11 +708,8 @@ class PropertyService:
             logger.warning("IFC file not available for property set creation")
             return None
 
-        import uuid
-        import ifcopenshell
-
         # GUID生成
-        guid = ifcopenshell.guid.compress(uuid.uuid4().hex)
+        guid, rel_guid = create_ifc_guids(2)
 
         pset = self.file.createIfcPropertySet(
             GlobalId=guid,
@@ -813,7 +719,6 @@ class PropertyService:
         )
 
         # 関連付け作成
-        rel_guid = ifcopenshell.guid.compress(uuid.uuid4().hex)
         self.file.createIfcRelDefinesByProperties(
             GlobalId=rel_guid,
             OwnerHistory=None,
@@ -4,6 +4,7 @@ v2.2.0 統合タイプ管理サービス
 全TypeManagerの機能を統合
 """
 
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 import logging
 
@@ -15,20 +16,31 @@ class TypeService:
     
     v2.2.0: 全ての要素タイプ管理を統一
     """
+
+    # タイプキャッシュの最大保持数（超過時は最も長く使われていないものから破棄）
+    TYPE_CACHE_MAXSIZE = 4096
     
-    def __init__(self):
+    def __init__(self, cache_maxsize: int = TYPE_CACHE_MAXSIZE):
         self.logger = logger
-        self._type_cache = {}
+        self._type_cache = OrderedDict()
+        self._cache_maxsize = cache_maxsize
         
     def get_element_type(self, element_name: str, element_category: str) -> Optional[Any]:
         """要素タイプを取得"""
-        cache_key = f"{element_category}_{element_name}"
-        return self._type_cache.get(cache_key)
+        cache_key = (element_category, element_name)
+        element_type = self._type_cache.get(cache_key)
+        if element_type is not None:
+            self._type_cache.move_to_end(cache_key)
+        return element_type
     
     def register_element_type(self, element_name: str, element_category: str, element_type: Any):
         """要素タイプを登録"""
-        cache_key = f"{element_category}_{element_name}"
+        cache_key = (element_category, element_name)
         self._type_cache[cache_key] = element_type
+        self._type_cache.move_to_end(cache_key)
+        if len(self._type_cache) > self._cache_maxsize:
+            evicted_key, _ = self._type_cache.popitem(last=False)
+            self.logger.debug("Type cache full, evicted %s", evicted_key)
         
     def create_beam_type(self, section_data: Dict[str, Any]) -> Any:
         """梁タイプを作成"""
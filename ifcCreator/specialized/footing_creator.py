@@ -2,8 +2,9 @@
 
 import ifcopenshell
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Iterator, Optional, List
 from common.geometry import Point3D
+from common.guid_utils import convert_stb_guid_to_ifc, create_ifc_guid
 from ..creators.base_creator import FoundationElementCreator
 from ..utils.structural_section import StructuralSection as FootingSection
 
@@ -43,23 +44,19 @@ class IFCFootingCreator(FoundationElementCreator):
 
             # 簡易実装：基本的なIFCFooting要素を作成
             ifc_file = self.project_builder.file
+            owner_history = self.project_builder.owner_history
 
-            # 位置を作成
-            location = ifc_file.createIfcCartesianPoint(
-                [float(bottom_point.x), float(bottom_point.y), float(bottom_point.z)]
-            )
-            placement_3d = ifc_file.createIfcAxis2Placement3D(Location=location)
-            placement = ifc_file.createIfcLocalPlacement(RelativePlacement=placement_3d)
-
-            # GUIDを生成または変換
-            from common.guid_utils import convert_stb_guid_to_ifc, create_ifc_guid
+            # 位置を作成（同一底面位置のフーチング間で共有）
+            placement = self._get_local_placement(bottom_point.xyz)
 
-            try:
-                if stb_guid:
+            # GUIDを変換（STB GUIDがない・不正な場合は新規生成）
+            element_guid = None
+            if stb_guid:
+                try:
                     element_guid = convert_stb_guid_to_ifc(stb_guid)
-                else:
-                    element_guid = create_ifc_guid()
-            except Exception:
+                except Exception:
+                    pass
+            if element_guid is None:
                 element_guid = create_ifc_guid()
 
             # フーチングの3D形状を作成
@@ -68,23 +65,28 @@ class IFCFootingCreator(FoundationElementCreator):
             )
             
             # IFCFooting要素を作成（3D形状付き）
-            footing = ifc_file.createIfcFooting(
-                GlobalId=element_guid,
-                OwnerHistory=self.project_builder.owner_history,
-                Name=footing_name,
-                ObjectPlacement=placement,
-                Representation=footing_shape,
-                Tag=footing_tag,
-                PredefinedType="FOOTING_BEAM",
+            # フーチング毎に作成されるため、属性名の解決を省く位置引数で指定する
+            footing = ifc_file.create_entity(
+                "IfcFooting",
+                element_guid,  # GlobalId
+                owner_history,  # OwnerHistory
+                footing_name,  # Name
+                None,  # Description
+                None,  # ObjectType
+                placement,  # ObjectPlacement
+                footing_shape,  # Representation
+                footing_tag,  # Tag
+                "FOOTING_BEAM",  # PredefinedType
             )
 
             # フーチング作成完了をデバッグログに記録
-            self.logger.debug(f"フーチングを作成しました: 名前={footing_name}, GUID={element_guid}")
-            self.logger.debug(f"フーチング '{footing_name}' を作成しました")
+            self.logger.debug(
+                "フーチングを作成しました: 名前=%s, GUID=%s", footing_name, element_guid
+            )
             return footing
 
         except Exception as e:
-            self.logger.error(f"フーチング作成エラー: {e}")
+            self.logger.error("フーチング作成エラー: %s", e)
             return None
 
     def _create_footing_geometry(
@@ -96,29 +98,43 @@ class IFCFootingCreator(FoundationElementCreator):
     ):
         """フーチングの3D形状を作成"""
         try:
-            # sectionが辞書の場合とStructuralSectionオブジェクトの場合を両方サポートするヘルパー関数
-            def get_section_property(key: str, default=None):
-                if hasattr(section, 'properties'):
-                    return section.properties.get(key, default)
-                else:
-                    return section.get(key, default)
+            # sectionが辞書の場合とStructuralSectionオブジェクトの場合を両方サポート
+            props = section.properties if hasattr(section, 'properties') else section
+            get = props.get
 
             # デフォルト寸法（section情報から取得、なければデフォルト値）
             # STB抽出キー(width_x, width_y)に対応
-            width = get_section_property('width_x', get_section_property('width_X', 1000.0))
-            length = get_section_property('width_y', get_section_property('width_Y', 1000.0))
-            height = get_section_property('depth', 600.0)
-
-            # 矩形断面プロファイルを作成
-            profile_def = ifc_file.createIfcRectangleProfileDef(
-                ProfileType="AREA",
-                ProfileName=f"FootingProfile_{width}x{length}",
-                XDim=float(width),
-                YDim=float(length)
-            )
+            width = get('width_x', get('width_X', 1000.0))
+            length = get('width_y', get('width_Y', 1000.0))
+            height = get('depth', 600.0)
+
+            context = self.project_builder.get_3d_context()
+
+            # 同一寸法のフーチングは製品定義形状ごと共有
+            # （配置はフーチング毎のObjectPlacementで表すため形状は位置に依存しない）
+            profile_name = f"FootingProfile_{width}x{length}"
+            shape_key = (profile_name, float(width), float(length), float(height), context)
+            shape_cache = self._get_entity_cache("IfcProductDefinitionShape")
+            product_shape = shape_cache.get(shape_key)
+            if product_shape is not None:
+                return product_shape
+
+            # 矩形断面プロファイルを作成（同一寸法のフーチング間で共有）
+            profile_key = (profile_name, float(width), float(length))
+            profile_cache = self._get_entity_cache("IfcRectangleProfileDef")
+            profile_def = profile_cache.get(profile_key)
+            if profile_def is None:
+                profile_def = profile_cache[profile_key] = (
+                    ifc_file.createIfcRectangleProfileDef(
+                        ProfileType="AREA",
+                        ProfileName=profile_name,
+                        XDim=float(width),
+                        YDim=float(length)
+                    )
+                )
 
             # 押出方向（垂直上向き）
-            extrusion_direction = ifc_file.createIfcDirection([0.0, 0.0, 1.0])
+            extrusion_direction = self._get_direction((0.0, 0.0, 1.0))
             
             # 押出しソリッドを作成
             solid = ifc_file.createIfcExtrudedAreaSolid(
@@ -130,47 +146,59 @@ class IFCFootingCreator(FoundationElementCreator):
 
             # 形状表現を作成
             shape_representation = ifc_file.createIfcShapeRepresentation(
-                ContextOfItems=self.project_builder.get_3d_context(),
+                ContextOfItems=context,
                 RepresentationIdentifier="Body",
                 RepresentationType="SweptSolid",
                 Items=[solid]
             )
 
             # 製品定義形状を作成
-            product_shape = ifc_file.createIfcProductDefinitionShape(
-                Representations=[shape_representation]
+            product_shape = shape_cache[shape_key] = (
+                ifc_file.createIfcProductDefinitionShape(
+                    Representations=[shape_representation]
+                )
             )
 
             return product_shape
 
         except Exception as e:
-            self.logger.error(f"フーチング形状作成エラー: {e}")
+            self.logger.error("フーチング形状作成エラー: %s", e)
             return None
 
     def create_footings(self, footing_defs: List[Dict]) -> List:
-        """フーチング要素リストを作成"""
-        footings = []
-        for footing_def in footing_defs:
-            try:
-                footing = self.create_footing_from_definition(footing_def)
-                if footing:
-                    footings.append(footing)
-            except Exception as e:
-                self.logger.error(
-                    f"フーチング作成エラー (ID: {footing_def.get('id', 'Unknown')}): {e}"
-                )
+        """フーチング要素リストを作成
+
+        定義毎のエラーは create_footing_from_definition 内で記録され、
+        作成に失敗したフーチングは結果から除外される。
+        """
+        if not footing_defs:
+            return []
+
+        footings = list(self.iter_footings(footing_defs))
 
-        self.logger.info(f"フーチング作成完了: {len(footings)}個")
+        self.logger.info("フーチング作成完了: %d個", len(footings))
         return footings
 
+    def iter_footings(self, footing_defs: Iterable[Dict]) -> Iterator[Any]:
+        """フーチング要素を作成しながら順に返す
+
+        作成済み要素のリストを保持しないため、件数の集計や1回だけの走査で
+        足りる呼び出し側はこちらを使用する。作成に失敗したフーチングは
+        返さない。
+        """
+        create = self.create_footing_from_definition
+        for footing_def in footing_defs:
+            footing = create(footing_def)
+            if footing is not None:
+                yield footing
+
     def create_footing_from_definition(self, footing_def: Dict) -> Optional[Any]:
         """フーチング定義からフーチング要素を作成"""
         try:
             # 座標情報の取得
+            bottom = footing_def.get("bottom_point", {})
             bottom_point = Point3D(
-                footing_def.get("bottom_point", {}).get("x", 0.0),
-                footing_def.get("bottom_point", {}).get("y", 0.0),
-                footing_def.get("bottom_point", {}).get("z", 0.0),
+                bottom.get("x", 0.0), bottom.get("y", 0.0), bottom.get("z", 0.0)
             )
 
             # 厚さから上端点を計算
@@ -180,18 +208,21 @@ class IFCFootingCreator(FoundationElementCreator):
             )
 
             # 断面情報の取得
-            section_info = footing_def.get("section_info", {})
+            section_get = footing_def.get("section_info", {}).get
             section = FootingSection(
-                section_name=section_info.get("stb_name", "F1"),
-                width_x=section_info.get("width_x", 1000.0),
-                width_y=section_info.get("width_y", 1000.0),
-                depth=section_info.get("depth", thickness),
-                section_type=section_info.get("section_type", "RECTANGLE"),
+                section_name=section_get("stb_name", "F1"),
+                width_x=section_get("width_x", 1000.0),
+                width_y=section_get("width_y", 1000.0),
+                depth=section_get("depth", thickness),
+                section_type=section_get("section_type", "RECTANGLE"),
             )
 
             # フーチング作成
             footing_name = footing_def.get("name", "Footing")
-            footing_tag = footing_def.get("tag", f"FT_{footing_def.get('id', '001')}")
+            if "tag" in footing_def:
+                footing_tag = footing_def["tag"]
+            else:
+                footing_tag = f"FT_{footing_def.get('id', '001')}"
             stb_guid = footing_def.get("stb_guid")
 
             return self.create_footing(
@@ -204,5 +235,5 @@ class IFCFootingCreator(FoundationElementCreator):
             )
 
         except Exception as e:
-            self.logger.error(f"フーチング定義解析エラー: {e}")
+            self.logger.error("フーチング定義解析エラー: %s", e)
             return None
@@ -4,6 +4,7 @@ IFC基礎柱作成のメインクラス（統合初期化対応）
 """
 import ifcopenshell
 import logging
+from functools import lru_cache
 from typing import Optional, Any
 from common.geometry import Point3D
 from ..creators.base_creator import StructuralElementCreatorBase
@@ -17,11 +18,32 @@ from ..utils.structural_section import StructuralSection as ColumnSection
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _rectangle_section(width: float, height: float) -> ColumnSection:
+    """基礎柱のRC矩形断面を取得（寸法毎に1つのインスタンスを共有）
+
+    Args:
+        width: X方向幅
+        height: Y方向幅
+
+    Returns:
+        矩形断面
+    """
+    return ColumnSection(section_type="RECTANGLE", width=width, height=height)
+
+
 class IFCFoundationColumnCreator(StructuralElementCreatorBase):
     """
     IFC基礎柱作成のメインクラス（統合初期化対応）
     StbFoundationColumn → IfcColumn として処理
     """
+
+    # 全基礎柱で共通の基礎柱識別プロパティ（名前, (型, 値)）
+    _BASIC_PROP_SPEC = (
+        ("IsFoundationColumn", ("boolean", True)),
+        ("FoundationColumnType", ("label", "RC_FOUNDATION_COLUMN")),
+        ("OriginalSTBType", ("label", "StbFoundationColumn")),
+    )
     
     def create_element(self, definition: dict) -> Optional[Any]:
         """基礎柱要素を作成（BaseElementCreatorの抽象メソッド実装）"""
@@ -83,22 +105,16 @@ class IFCFoundationColumnCreator(StructuralElementCreatorBase):
                 )
 
             # 基礎柱の底面と頂面の点を計算（下の節点から上方向へ）
+            top_z = z + column_length  # 上方向への長さ
             bottom_point = Point3D(x, y, z)
-            top_point = Point3D(x, y, z + column_length)  # 上方向への長さ
+            top_point = Point3D(x, y, top_z)
 
             logger.debug(
                 "基礎柱位置: 底面=(%f, %f, %f), 頂面=(%f, %f, %f)",
-                bottom_point.x,
-                bottom_point.y,
-                bottom_point.z,
-                top_point.x,
-                top_point.y,
-                top_point.z,
-            )  # 統一的なファクトリーメソッドを使用してColumnSectionを作成（RC矩形断面）
-            column_section = ColumnSection.create_rectangle(
-                width=width,  # X方向幅
-                height=height,  # Y方向幅
+                x, y, z, x, y, top_z,
             )
+            # RC矩形断面（同一寸法の基礎柱間で共有）
+            column_section = _rectangle_section(width, height)
 
             # 既存のcreate_columnメソッドを使用（内部的にIfcColumnを作成）
             ifc_column = self.create_column(
@@ -124,7 +140,8 @@ class IFCFoundationColumnCreator(StructuralElementCreatorBase):
         except Exception as e:
             logger.error("基礎柱作成中にエラーが発生しました: %s", str(e))
             logger.error("基礎柱データ: %s", foundation_column_data)
-            logger.error("エラー詳細", exc_info=True)
+            # トレースバックはDEBUG有効時のみ整形・出力する
+            logger.debug("エラー詳細", exc_info=True)
             return None
 
     def create_column(
@@ -204,25 +221,20 @@ class IFCFoundationColumnCreator(StructuralElementCreatorBase):
     ):
         """基礎柱特有のプロパティを追加（リファクタリング版）"""
         try:
-            # property_managerが初期化されていない場合のフォールバック
-            if self.property_manager is None:
-                # 一時的なPropertyManagerを作成
-                from ..utils.property_manager_base import ColumnPropertyManager
-
-                temp_property_manager = ColumnPropertyManager(
-                    ifc_file, self.project_builder.owner_history
+            # property_managerはプロジェクト構造の初期化時に作成される
+            property_manager = self.property_manager
+            if property_manager is None:
+                logger.warning(
+                    "property_managerが未初期化のため基礎柱プロパティを追加しません"
                 )
-            else:
-                temp_property_manager = self.property_manager
+                return
 
             # 基礎柱識別プロパティ
-            basic_property_data = {
-                "IsFoundationColumn": ("boolean", True),
-                "FoundationColumnType": ("label", "RC_FOUNDATION_COLUMN"),
-                "OriginalSTBType": ("label", "StbFoundationColumn"),
-                "StructuralKind": ("label", foundation_column_data["kind_structure"]),
-            }
-            basic_props = temp_property_manager.create_structural_properties(
+            basic_property_data = dict(self._BASIC_PROP_SPEC)
+            basic_property_data["StructuralKind"] = (
+                "label", foundation_column_data["kind_structure"]
+            )
+            basic_props = property_manager.create_structural_properties(
                 basic_property_data
             )
 
@@ -230,11 +242,11 @@ class IFCFoundationColumnCreator(StructuralElementCreatorBase):
             fd_section = foundation_column_data["fd_section"]
             fd_props = []
             if fd_section["section_info"]:
-                fd_props = temp_property_manager.create_section_info_properties(
+                fd_props = property_manager.create_section_info_properties(
                     fd_section, "FD_"
                 )
             else:
-                fd_props = temp_property_manager.create_structural_properties(
+                fd_props = property_manager.create_structural_properties(
                     {"FD_Section": ("label", "None (ID=0)")}
                 )
 
@@ -242,17 +254,17 @@ class IFCFoundationColumnCreator(StructuralElementCreatorBase):
             wr_props = []
             wr_section = foundation_column_data.get("wr_section")
             if wr_section:
-                wr_props = temp_property_manager.create_section_info_properties(
+                wr_props = property_manager.create_section_info_properties(
                     wr_section, "WR_"
                 )
                 # プライマリセクションタイプを追加
                 wr_props.extend(
-                    temp_property_manager.create_structural_properties(
+                    property_manager.create_structural_properties(
                         {"PrimarySectionType": ("label", "WR (Wall Rising)")}
                     )
                 )
             else:
-                wr_props = temp_property_manager.create_structural_properties(
+                wr_props = property_manager.create_structural_properties(
                     {"PrimarySectionType": ("label", "FD (Foundation)")}
                 )
 
@@ -260,7 +272,7 @@ class IFCFoundationColumnCreator(StructuralElementCreatorBase):
             all_properties = basic_props + fd_props + wr_props
 
             # プロパティセットを作成して関連付け
-            temp_property_manager._create_property_set(
+            property_manager._create_property_set(
                 "STB_FoundationColumn_Properties", all_properties, ifc_column
             )
 
@@ -1,7 +1,10 @@
 """基礎要素（フーチング）の生成クリエーター"""
 
 from typing import Dict, List
+from exceptions.custom_errors import ConversionError
 from .base_element_creator import BaseElementCreator, logger
+from .footing_creator import IFCFootingCreator
+from .foundation_column_creator import IFCFoundationColumnCreator
 
 
 class FoundationElementCreator(BaseElementCreator):
@@ -82,7 +85,6 @@ class FoundationElementCreator(BaseElementCreator):
     ):
         """フーチング専用プロジェクト作成（統合された実装）"""
         from ifcCreator.footing import create_footing_project_with_coordinates as _impl
-        from exceptions.custom_errors import ConversionError
 
         try:
             return _impl(filename, footing_defs, project_name)
@@ -100,7 +102,6 @@ class FoundationElementCreator(BaseElementCreator):
 
     def _initialize_footing_creator(self):
         """フーチングCreatorを初期化"""
-        from ifcCreator.footing_creator import IFCFootingCreator
         from ifcCreator.unified_definition_processor import (
             UnifiedDefinitionProcessor,
         )
@@ -173,10 +174,6 @@ class FoundationElementCreator(BaseElementCreator):
 
     def _initialize_foundation_column_creator(self):
         """基礎柱作成器を初期化"""
-        from ifcCreator.foundation_column_creator import (
-            IFCFoundationColumnCreator,
-        )
-
         foundation_column_creator = IFCFoundationColumnCreator()
         foundation_column_creator.project_builder = self.project_builder
 
@@ -11,10 +11,34 @@ from ..creators.base_creator import StructuralElementCreatorBase
 from common.geometry import Point3D
 from common.guid_utils import create_ifc_guid
 import logging
+import math
+import traceback
 
 logger = logging.getLogger(__name__)
 
 
+def _is_u_axis_group(group_name: str, angle: float) -> bool:
+    """通芯グループがU方向（主にX方向）かを判定
+
+    グループ名に X を含む場合はU方向、Y を含む場合はV方向とし、
+    どちらも含まない場合は角度から判断する。
+
+    Args:
+        group_name: 通芯グループ名
+        angle: 通芯グループの角度（度）
+
+    Returns:
+        U方向の場合True、V方向の場合False
+    """
+    name = group_name.upper()
+    if "X" in name:
+        return True
+    if "Y" in name:
+        return False
+    normalized = abs(angle % 180)
+    return normalized < 45 or normalized > 135
+
+
 class GridPropertyManager:
     """通芯用プロパティマネージャー（簡素化実装）"""
 
@@ -74,8 +98,6 @@ class IFCGridCreator(StructuralElementCreatorBase):
                 logger.info("プロジェクト構造を使用")
         except Exception as e:
             logger.error("初期化段階でエラー: %s", e)
-            import traceback
-
             logger.error("トレースバック: %s", traceback.format_exc())
             return None
 
@@ -94,6 +116,11 @@ class IFCGridCreator(StructuralElementCreatorBase):
                 angle = group.get("angle", 0)
                 axes = group.get("axes", [])
 
+                # グループ内の軸は全て同じ方向に属するため、判定はグループ毎に1回
+                target_axes = (
+                    all_u_axes if _is_u_axis_group(group_name, angle) else all_v_axes
+                )
+
                 for axis_data in axes:
                     axis_name = axis_data.get("name", "Unknown")
                     start_point = axis_data.get("start_point")
@@ -109,23 +136,7 @@ class IFCGridCreator(StructuralElementCreatorBase):
                     )
 
                     if grid_axis:
-                        # グループ名に基づいて方向を決定
-                        if (
-                            group_name.upper().startswith("X")
-                            or "X" in group_name.upper()
-                        ):
-                            all_u_axes.append(grid_axis)
-                        elif (
-                            group_name.upper().startswith("Y")
-                            or "Y" in group_name.upper()
-                        ):
-                            all_v_axes.append(grid_axis)
-                        else:
-                            # 角度や座標から判断
-                            if abs(angle % 180) < 45 or abs(angle % 180) > 135:
-                                all_u_axes.append(grid_axis)  # 主にX方向
-                            else:
-                                all_v_axes.append(grid_axis)  # 主にY方向
+                        target_axes.append(grid_axis)
 
             if not all_u_axes and not all_v_axes:
                 logger.warning("有効な通芯軸が見つかりません")
@@ -140,8 +151,6 @@ class IFCGridCreator(StructuralElementCreatorBase):
             return grid
         except Exception as e:
             logger.error("IfcGrid作成中にエラー: %s", e)
-            import traceback
-
             logger.error("トレースバック: %s", traceback.format_exc())
             return None
 
@@ -161,35 +170,28 @@ class IFCGridCreator(StructuralElementCreatorBase):
         ifc_file = self.project_builder.file
 
         try:
-            # 開始点と終了点のIfcCartesianPointを作成
-            start_ifc_point = ifc_file.createIfcCartesianPoint(
-                [
-                    float(start_point["x"]),
-                    float(start_point["y"]),
-                    float(start_point["z"]),
-                ]
+            # 座標を1回だけ取り出してfloatに変換
+            sx, sy, sz = (
+                float(start_point["x"]),
+                float(start_point["y"]),
+                float(start_point["z"]),
             )
-
-            end_ifc_point = ifc_file.createIfcCartesianPoint(
-                [float(end_point["x"]), float(end_point["y"]), float(end_point["z"])]
+            ex, ey, ez = (
+                float(end_point["x"]),
+                float(end_point["y"]),
+                float(end_point["z"]),
             )
 
-            # IfcLineを作成
-            direction_vector = [
-                float(end_point["x"] - start_point["x"]),
-                float(end_point["y"] - start_point["y"]),
-                float(end_point["z"] - start_point["z"]),
-            ]
-
-            # 方向ベクトルを正規化
-            length = sum(v**2 for v in direction_vector) ** 0.5
-            if length > 0:
-                direction_vector = [v / length for v in direction_vector]
-            else:
+            # 方向ベクトルと長さ
+            dx, dy, dz = ex - sx, ey - sy, ez - sz
+            length = math.hypot(dx, dy, dz)
+            if length <= 0:
                 logger.warning("通芯 %s の長さが0です", axis_name)
                 return None
 
-            direction = ifc_file.createIfcDirection(direction_vector)
+            # 開始点・方向は端点や向きが共通する通芯間で共有
+            start_ifc_point = self._get_cartesian_point((sx, sy, sz))
+            direction = self._get_direction((dx / length, dy / length, dz / length))
             vector = ifc_file.createIfcVector(direction, length)
             line = ifc_file.createIfcLine(start_ifc_point, vector)
 
@@ -216,11 +218,12 @@ class IFCGridCreator(StructuralElementCreatorBase):
             作成されたIfcGridオブジェクト
         """
         ifc_file = self.project_builder.file
+        owner_history = self.project_builder.owner_history
 
         # IfcGridを作成
         grid = ifc_file.createIfcGrid(
             GlobalId=create_ifc_guid(),
-            OwnerHistory=self.project_builder.owner_history,
+            OwnerHistory=owner_history,
             Name="構造通芯",
             Description="ST-Bridgeから変換された構造通芯",
             UAxes=u_axes if u_axes else None,
@@ -228,36 +231,36 @@ class IFCGridCreator(StructuralElementCreatorBase):
             WAxes=None,  # 3D軸は今回は対応しない
         )
 
-        # 配置情報を設定
-        placement = ifc_file.createIfcLocalPlacement(
-            PlacementRelTo=None,  # ワールド座標系
-            RelativePlacement=ifc_file.createIfcAxis2Placement3D(
-                Location=ifc_file.createIfcCartesianPoint([0.0, 0.0, 0.0])
-            ),
-        )
-        grid.ObjectPlacement = placement
+        # 配置情報を設定（ワールド座標系の原点、同一ファイル内で共有）
+        grid.ObjectPlacement = self._get_local_placement((0.0, 0.0, 0.0))
 
         # 空間構造に追加（Buildingレベルに配置）
-        logger.info("プロジェクトビルダーの空間構造確認:")
-        logger.info("  building: %s", getattr(self.project_builder, "building", None))
-        logger.info("  site: %s", getattr(self.project_builder, "site", None))
-        logger.info("  storey: %s", getattr(self.project_builder, "storey", None))
+        building = getattr(self.project_builder, "building", None)
+        site = getattr(self.project_builder, "site", None)
+        storey = getattr(self.project_builder, "storey", None)
+        logger.info(
+            "プロジェクトビルダーの空間構造確認:\n"
+            "  building: %s\n  site: %s\n  storey: %s",
+            building,
+            site,
+            storey,
+        )
 
         relating_structure = None
-        if hasattr(self.project_builder, "building") and self.project_builder.building:
-            relating_structure = self.project_builder.building
+        if building:
+            relating_structure = building
             logger.info("通芯をBuildingレベルに配置")
-        elif hasattr(self.project_builder, "site") and self.project_builder.site:
-            relating_structure = self.project_builder.site
+        elif site:
+            relating_structure = site
             logger.info("通芯をSiteレベルに配置")
-        elif hasattr(self.project_builder, "storey") and self.project_builder.storey:
-            relating_structure = self.project_builder.storey
+        elif storey:
+            relating_structure = storey
             logger.info("通芯をStoreyレベルに配置")
 
         if relating_structure:
             rel_contains = ifc_file.createIfcRelContainedInSpatialStructure(
                 GlobalId=create_ifc_guid(),
-                OwnerHistory=self.project_builder.owner_history,
+                OwnerHistory=owner_history,
                 RelatingStructure=relating_structure,
                 RelatedElements=[grid],
             )
@@ -274,10 +277,12 @@ class IFCGridCreator(StructuralElementCreatorBase):
 class GridDefinitionProcessor:
     """通芯定義辞書を検証・変換するクラス"""
 
+    # 通芯軸の必須フィールドと、始点・終点の必須座標
+    _REQUIRED_FIELDS = frozenset(("name", "start_point", "end_point"))
+    _REQUIRED_COORDS = frozenset(("x", "y", "z"))
+
     def process(self, axes_groups: List[Dict]) -> List[Dict]:
         """通芯グループリストを処理"""
-        import json
-
         logger.debug("通芯定義処理開始:")
         logger.debug("通芯グループ数: %d", len(axes_groups))
 
@@ -299,10 +304,17 @@ class GridDefinitionProcessor:
             logger.warning("通芯グループ %s に軸がありません", group_name)
             return None
 
-        processed_axes = []
-        for axis in axes:
-            if self._validate_axis(axis):
-                processed_axes.append(axis)
+        validate = self._validate_axis
+        processed_axes = [axis for axis in axes if validate(axis)]
+
+        # 不正な軸は1本ずつではなくグループ毎にまとめて警告
+        invalid_count = len(axes) - len(processed_axes)
+        if invalid_count:
+            logger.warning(
+                "通芯グループ %s の不正な軸 %d 本をスキップしました",
+                group_name,
+                invalid_count,
+            )
 
         if not processed_axes:
             logger.warning("通芯グループ %s に有効な軸がありません", group_name)
@@ -317,26 +329,14 @@ class GridDefinitionProcessor:
         }
 
     def _validate_axis(self, axis: Dict) -> bool:
-        """通芯軸の検証"""
-        required_fields = ["name", "start_point", "end_point"]
-
-        for field in required_fields:
-            if field not in axis:
-                logger.warning("通芯軸に必須フィールド %s がありません", field)
-                return False
+        """通芯軸の検証（必須フィールドと始点・終点の座標）"""
+        if not self._REQUIRED_FIELDS.issubset(axis):
+            return False
 
-        # 座標の検証
-        for point_name in ["start_point", "end_point"]:
+        required_coords = self._REQUIRED_COORDS
+        for point_name in ("start_point", "end_point"):
             point = axis[point_name]
-            if not isinstance(point, dict):
-                logger.warning("通芯軸の %s が辞書形式ではありません", point_name)
+            if not isinstance(point, dict) or not required_coords.issubset(point):
                 return False
 
-            for coord in ["x", "y", "z"]:
-                if coord not in point:
-                    logger.warning(
-                        "通芯軸の %s に座標 %s がありません", point_name, coord
-                    )
-                    return False
-
         return True
@@ -6,7 +6,9 @@ Phase 2 基礎要素実装: パラペット（Parapet）専用クリエーター
 
 import ifcopenshell
 import logging
-from typing import Dict, Any, Optional, List
+import math
+import operator
+from typing import Dict, Any, Optional, List, Tuple
 from common.geometry import Point3D
 from ..creators.base_creator import PlanarElementCreator
 from ..utils.structural_section import StructuralSection
@@ -15,6 +17,25 @@ from exceptions.custom_errors import ParameterValidationError, GeometryValidatio
 
 logger = logging.getLogger(__name__)
 
+# (x, y, z) 座標タプル
+Coordinates = Tuple[float, float, float]
+
+# 座標辞書の必須キーと (x, y, z) の一括取得
+_REQUIRED_COORDINATES = frozenset(("x", "y", "z"))
+_xyz = operator.itemgetter("x", "y", "z")
+
+
+def _polyline_length(coordinates: List[Coordinates]) -> float:
+    """折れ線の全長を計算
+
+    Args:
+        coordinates: 頂点の (x, y, z) タプルのリスト
+
+    Returns:
+        隣接する頂点間の距離の総和
+    """
+    return sum(map(math.dist, coordinates, coordinates[1:]))
+
 
 class ParapetCreator(PlanarElementCreator):
     """パラペット作成クラス
@@ -50,8 +71,11 @@ class ParapetCreator(PlanarElementCreator):
             # パラメータ検証
             self._validate_parapet_definition(definition)
             
-            # 基本パラメータの抽出
-            corner_nodes = [self._extract_point(node) for node in definition.get("corner_nodes", [])]
+            # 基本パラメータの抽出（コーナーノードは座標タプルとして保持）
+            corner_coords = [
+                self._extract_coordinates(node)
+                for node in definition.get("corner_nodes", [])
+            ]
             section = definition.get("section", {})
             
             # 寸法情報の抽出
@@ -66,7 +90,7 @@ class ParapetCreator(PlanarElementCreator):
 
             # IFC要素作成
             return self._create_parapet_ifc(
-                corner_nodes=corner_nodes,
+                corner_coords=corner_coords,
                 height=height,
                 thickness=thickness,
                 parapet_name=parapet_name,
@@ -76,7 +100,7 @@ class ParapetCreator(PlanarElementCreator):
             )
 
         except Exception as e:
-            self.logger.error(f"パラペット作成エラー: {e}")
+            self.logger.error("パラペット作成エラー: %s", e)
             return None
 
     def _validate_parapet_definition(self, definition: Dict[str, Any]) -> None:
@@ -104,30 +128,27 @@ class ParapetCreator(PlanarElementCreator):
             if not self._is_valid_point(node):
                 raise GeometryValidationError("パラペット", f"corner_node_{i}", f"コーナーノード{i+1}が無効です")
 
-    def _extract_point(self, point_data: Any) -> Point3D:
-        """座標データをPoint3Dに変換"""
+    def _extract_coordinates(self, point_data: Any) -> Coordinates:
+        """座標データを (x, y, z) のfloatタプルに変換
+
+        辞書の座標キーは _is_valid_point で検証済みであることを前提とする。
+        """
         if isinstance(point_data, Point3D):
-            return point_data
-        elif isinstance(point_data, dict):
-            return Point3D(
-                point_data.get("x", 0.0),
-                point_data.get("y", 0.0),
-                point_data.get("z", 0.0)
-            )
-        else:
-            raise ValueError(f"無効な座標データ: {point_data}")
+            return point_data.xyz
+        if isinstance(point_data, dict):
+            x, y, z = _xyz(point_data)
+            return (float(x), float(y), float(z))
+        raise ValueError(f"無効な座標データ: {point_data}")
 
     def _is_valid_point(self, point_data: Any) -> bool:
         """座標点の有効性をチェック"""
-        if isinstance(point_data, Point3D):
-            return True
-        elif isinstance(point_data, dict):
-            return all(coord in point_data for coord in ["x", "y", "z"])
-        return False
+        if isinstance(point_data, dict):
+            return point_data.keys() >= _REQUIRED_COORDINATES
+        return isinstance(point_data, Point3D)
 
     def _create_parapet_ifc(
         self, 
-        corner_nodes: List[Point3D],
+        corner_coords: List[Coordinates],
         height: float,
         thickness: float,
         parapet_name: str,
@@ -142,30 +163,22 @@ class ParapetCreator(PlanarElementCreator):
                 return None
 
             ifc_file = self.project_builder.file
+            context = self.project_builder.get_3d_context()
 
-            # 1. パラペットの基準点を計算（最初のコーナーノード）
-            base_point = corner_nodes[0]
-
-            # 2. 位置情報を作成
-            location = ifc_file.createIfcCartesianPoint([
-                float(base_point.x), 
-                float(base_point.y), 
-                float(base_point.z)
-            ])
-
-            # 3. 配置情報を作成
-            placement = ifc_file.createIfcAxis2Placement3D(location)
+            # 1-3. 基準点（最初のコーナーノード）の配置情報を作成
+            # （同一基準点の要素間で共有）
+            placement = self._get_local_placement(corner_coords[0])
 
             # 4. パラペットの形状を作成
             # 線形パラペットの場合（2点間）
-            if len(corner_nodes) == 2:
+            if len(corner_coords) == 2:
                 parapet_shape = self._create_linear_parapet_shape(
-                    corner_nodes[0], corner_nodes[1], height, thickness
+                    corner_coords[0], corner_coords[1], height, thickness
                 )
             else:
                 # 複数点のパラペット（L字型など）
                 parapet_shape = self._create_polyline_parapet_shape(
-                    corner_nodes, height, thickness
+                    corner_coords, height, thickness
                 )
 
             if not parapet_shape:
@@ -174,7 +187,7 @@ class ParapetCreator(PlanarElementCreator):
 
             # 5. 形状表現を作成
             shape_representation = ifc_file.createIfcShapeRepresentation(
-                ContextOfItems=self.project_builder.get_3d_context(),
+                ContextOfItems=context,
                 RepresentationIdentifier="Body",
                 RepresentationType="SweptSolid",
                 Items=[parapet_shape]
@@ -189,33 +202,36 @@ class ParapetCreator(PlanarElementCreator):
                 GlobalId=self.project_builder.create_guid(stb_guid),
                 Name=parapet_name,
                 Tag=parapet_tag,
-                ObjectPlacement=ifc_file.createIfcLocalPlacement(
-                    RelativePlacement=placement
-                ),
+                ObjectPlacement=placement,
                 Representation=product_shape,
                 PredefinedType="PARAPET"
             )
 
+            # パラペット長さを計算（プロパティ設定とログで共用）
+            parapet_length = self._calculate_parapet_length(corner_coords)
+
             # 7. 材料・プロパティの設定
-            self._assign_parapet_properties(parapet, section, height, thickness, corner_nodes)
+            self._assign_parapet_properties(
+                parapet, section, height, thickness, parapet_length
+            )
 
             # 8. 関連付け
             self.project_builder.relate_to_building_element(parapet)
 
-            # パラペット長さを計算
-            parapet_length = self._calculate_parapet_length(corner_nodes)
-            
-            self.logger.info(f"パラペット '{parapet_name}' を作成しました（長さ:{parapet_length:.1f}mm, 高さ:{height:.1f}mm, 厚さ:{thickness:.1f}mm）")
+            self.logger.info(
+                "パラペット '%s' を作成しました（長さ:%.1fmm, 高さ:%.1fmm, 厚さ:%.1fmm）",
+                parapet_name, parapet_length, height, thickness,
+            )
             return parapet
 
         except Exception as e:
-            self.logger.error(f"IFCパラペット作成エラー: {e}")
+            self.logger.error("IFCパラペット作成エラー: %s", e)
             return None
 
     def _create_linear_parapet_shape(
         self, 
-        start_point: Point3D, 
-        end_point: Point3D, 
+        start_point: Coordinates, 
+        end_point: Coordinates, 
         height: float, 
         thickness: float
     ) -> Optional[Any]:
@@ -223,13 +239,11 @@ class ParapetCreator(PlanarElementCreator):
         try:
             ifc_file = self.project_builder.file
             
-            # パラペットの長さを計算
-            import math
-            length = math.sqrt(
-                (end_point.x - start_point.x) ** 2 +
-                (end_point.y - start_point.y) ** 2 +
-                (end_point.z - start_point.z) ** 2
-            )
+            # パラペットの長さを計算（座標差は押し出し方向でも使用）
+            sx, sy, sz = start_point
+            ex, ey, ez = end_point
+            dx, dy, dz = ex - sx, ey - sy, ez - sz
+            length = math.hypot(dx, dy, dz)
 
             # 断面プロファイル（矩形）
             profile_def = ifc_file.createIfcRectangleProfileDef(
@@ -241,15 +255,11 @@ class ParapetCreator(PlanarElementCreator):
 
             # 押し出し方向と距離
             if length > 0:
-                direction = [
-                    (end_point.x - start_point.x) / length,
-                    (end_point.y - start_point.y) / length,
-                    (end_point.z - start_point.z) / length
-                ]
+                direction = (dx / length, dy / length, dz / length)
             else:
-                direction = [1.0, 0.0, 0.0]
+                direction = (1.0, 0.0, 0.0)
 
-            extrusion_direction = ifc_file.createIfcDirection(direction)
+            extrusion_direction = self._get_direction(direction)
             
             solid = ifc_file.createIfcExtrudedAreaSolid(
                 SweptArea=profile_def,
@@ -261,12 +271,12 @@ class ParapetCreator(PlanarElementCreator):
             return solid
 
         except Exception as e:
-            self.logger.error(f"線形パラペット形状作成エラー: {e}")
+            self.logger.error("線形パラペット形状作成エラー: %s", e)
             return None
 
     def _create_polyline_parapet_shape(
         self, 
-        corner_nodes: List[Point3D], 
+        corner_coords: List[Coordinates], 
         height: float, 
         thickness: float
     ) -> Optional[Any]:
@@ -276,34 +286,20 @@ class ParapetCreator(PlanarElementCreator):
 
             # 簡略化：最初の2点間で線形パラペットを作成
             # 実際の実装では、全ての点を使用してより複雑な形状を作成する
-            if len(corner_nodes) >= 2:
+            if len(corner_coords) >= 2:
                 return self._create_linear_parapet_shape(
-                    corner_nodes[0], corner_nodes[1], height, thickness
+                    corner_coords[0], corner_coords[1], height, thickness
                 )
             
             return None
 
         except Exception as e:
-            self.logger.error(f"複数点パラペット形状作成エラー: {e}")
+            self.logger.error("複数点パラペット形状作成エラー: %s", e)
             return None
 
-    def _calculate_parapet_length(self, corner_nodes: List[Point3D]) -> float:
+    def _calculate_parapet_length(self, corner_coords: List[Coordinates]) -> float:
         """パラペット全体の長さを計算"""
-        total_length = 0.0
-        import math
-        
-        for i in range(len(corner_nodes) - 1):
-            start = corner_nodes[i]
-            end = corner_nodes[i + 1]
-            
-            length = math.sqrt(
-                (end.x - start.x) ** 2 +
-                (end.y - start.y) ** 2 +
-                (end.z - start.z) ** 2
-            )
-            total_length += length
-            
-        return total_length
+        return _polyline_length(corner_coords)
 
     def _assign_parapet_properties(
         self, 
@@ -311,15 +307,18 @@ class ParapetCreator(PlanarElementCreator):
         section: Any, 
         height: float,
         thickness: float,
-        corner_nodes: List[Point3D]
+        parapet_length: float
     ) -> None:
-        """パラペットにプロパティを割り当て"""
+        """パラペットにプロパティを割り当て
+
+        Args:
+            parapet_length: 計算済みのパラペット全長
+        """
         try:
             if not self.project_builder:
                 return
 
             # 寸法プロパティセット
-            parapet_length = self._calculate_parapet_length(corner_nodes)
             dimension_props = {
                 "Height": height,
                 "Thickness": thickness,
@@ -353,4 +352,4 @@ class ParapetCreator(PlanarElementCreator):
                 )
 
         except Exception as e:
-            self.logger.warning(f"パラペットプロパティ設定エラー: {e}")
\ No newline at end of file
+            self.logger.warning("パラペットプロパティ設定エラー: %s", e)
@@ -0,0 +1,85 @@
+"""プロファイル名による形状分類・型選択のテスト"""
+
+import importlib.util
+import pathlib
+
+import pytest
+
+from common.profile_naming_standards import classify_profile
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def _load_creator(module_name, class_name):
+    """creatorsモジュールを直接読み込む
+
+    ifcCreatorパッケージの初期化はifcopenshellを必要とするため、
+    依存のないモジュールファイルを直接読み込む。
+    """
+    path = _ROOT / "ifcCreator" / "creators" / f"{module_name}.py"
+    spec = importlib.util.spec_from_file_location(f"_{module_name}_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+class _FakeEntity:
+    def __init__(self, entity_type, **attributes):
+        self.entity_type = entity_type
+        self.__dict__.update(attributes)
+
+
+class _FakeFile:
+    def create_entity(self, entity_type, **attributes):
+        return _FakeEntity(entity_type, **attributes)
+
+
+@pytest.mark.parametrize(
+    "profile_name, expected",
+    [
+        ("H_200x100x5.5x8.0", "H"),
+        ("HProfile_200.0x100.0x5.5x8.0_FR8.0", "H"),
+        ("IProfile_200.0x100.0x5.5x8.0_FR8.0", "H"),
+        ("BOX_200x200x6", "BOX"),
+        ("BoxProfile_200", "BOX"),
+        ("HOLLOW_300x300x9", "HOLLOW"),
+        ("RectProfile_300.0x500.0", "RECT"),
+        ("RectangleProfile_600x600", "RECT"),
+        ("rect_600", "RECT"),
+        ("CircleProfile_216.3", "OTHER"),
+        ("LProfile_100x100x7", "OTHER"),
+        ("", "OTHER"),
+        (None, "OTHER"),
+    ],
+)
+def test_classify_profile_matches_leading_keyword(profile_name, expected):
+    assert classify_profile(profile_name) == expected
+
+
+@pytest.mark.parametrize(
+    "profile_name, beam_type, column_type, material",
+    [
+        ("H_200x100x5.5x8.0", "SteelBeam", "SteelColumn", "Steel"),
+        ("BOX_200", "StandardBeam", "CFTColumn", "Steel"),
+        ("BoxProfile_200", "StandardBeam", "CFTColumn", "Steel"),
+        ("HOLLOW_300x300x9", "SteelBeam", "SteelColumn", "Steel"),
+        ("RECT_600x600", "ConcreteBeam", "ConcreteColumn", "Concrete"),
+        ("RectangleProfile_600x600", "ConcreteBeam", "ConcreteColumn", "Concrete"),
+        ("rect_600", "ConcreteBeam", "ConcreteColumn", "Concrete"),
+        ("CircleProfile", "StandardBeam", "StandardColumn", "Steel"),
+    ],
+)
+def test_type_and_material_creators_share_profile_class(
+    profile_name, beam_type, column_type, material
+):
+    ifc_file = _FakeFile()
+    type_creator = _load_creator("type_creator", "TypeCreator")(
+        ifc_file, owner_history=None
+    )
+    material_creator = _load_creator("material_creator", "MaterialCreator")(
+        ifc_file, owner_history=None
+    )
+
+    assert type_creator.get_beam_type_for_profile(profile_name).Name == beam_type
+    assert type_creator.get_column_type_for_profile(profile_name).Name == column_type
+    assert material_creator.get_material_for_profile(profile_name).Name == material